@@ -3,94 +3,126 @@
 Script to parse scene file and apply changes to X32 console
 """
 
-import socket
+import argparse
+import asyncio
+import mmap
 import struct
-import sys
 import time
 import os
 import re
+from typing import NamedTuple, Union
 
-def create_osc_message(address, *args):
-    """Create OSC message"""
-    message = address.encode('utf-8')
-    message += b'\x00' * (4 - len(message) % 4)
-
-    type_tags = ','
-    for arg in args:
-        if isinstance(arg, bool):
-            type_tags += 'T' if arg else 'F'
-        elif isinstance(arg, int):
-            type_tags += 'i'
-        elif isinstance(arg, float):
-            type_tags += 'f'
-        elif isinstance(arg, str):
-            type_tags += 's'
-
-    message += type_tags.encode('utf-8')
-    message += b'\x00' * (4 - len(type_tags) % 4)
-
-    for arg in args:
-        if isinstance(arg, bool):
-            pass
-        elif isinstance(arg, int):
-            message += struct.pack('>i', arg)
-        elif isinstance(arg, float):
-            message += struct.pack('>f', arg)
-        elif isinstance(arg, str):
-            message += arg.encode('utf-8')
-            message += b'\x00' * (4 - len(arg.encode('utf-8')) % 4)
-
-    return message
+from osc_batch import BURST_SNDBUF, cached_socket, send_many
+from osc_codec import create_osc_bundle, create_osc_message, group_messages, osc_header
+
+_PACK_F = struct.Struct('>f')
+
+class SceneChange(NamedTuple):
+    """One OSC write parsed from a scene file"""
+    action: str
+    channel: int
+    address: str
+    value: Union[bool, float]
+
+def coalesce_changes(changes):
+    """Keep only the last write to each OSC address, in first-seen order"""
+    latest = {}
+    for change in changes:
+        latest[change.address] = change
+    return list(latest.values())
+
+def create_osc_batch(messages):
+    """Encode (address, value) pairs back to back into one shared buffer
+
+    Returns one memoryview slice per message, so a whole scene is encoded
+    with a single allocation and handed to the socket without copies.
+    """
+    parts = []
+    size = 0
+    for address, value in messages:
+        if isinstance(value, bool):
+            header, payload = osc_header(address, ',T' if value else ',F'), None
+        elif isinstance(value, float):
+            header, payload = osc_header(address, ',f'), value
+        else:
+            header, payload = create_osc_message(address, value), None
+        parts.append((header, payload))
+        size += len(header) + (4 if payload is not None else 0)
+
+    buf = bytearray(size)
+    view = memoryview(buf)
+    batch = []
+    offset = 0
+    for header, payload in parts:
+        end = offset + len(header)
+        buf[offset:end] = header
+        if payload is not None:
+            _PACK_F.pack_into(buf, end, payload)
+            end += 4
+        batch.append(view[offset:end])
+        offset = end
+
+    return batch
 
 def send_osc_message(ip_address, port, address, *args):
     """Send OSC message to X32"""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.settimeout(2)
         message = create_osc_message(address, *args)
-        sock.sendto(message, (ip_address, port))
-        sock.close()
+        cached_socket(ip_address, port, sndbuf=BURST_SNDBUF, tune=True).send(message)
         return True
     except Exception as e:
         print(f"Error sending OSC message: {e}")
         return False
 
+# X32 addresses for channels 1-32, indexed by channel number
+_ON_ADDR = [f"/ch/{i:02d}/mix/on" for i in range(33)]
+_FADER_ADDR = [f"/ch/{i:02d}/mix/fader" for i in range(33)]
+
+# Format: /ch/01/mix OFF  +8.1 ON +24 OFF   -oo
+_CH_MIX_RE = re.compile(rb'^[ \t]*/ch/(\d+)/mix[ \t]+(ON|OFF)[ \t]+(\S+)', re.M)
+
+def _channel_block(data):
+    """Return the (start, end) byte range spanning every /ch/ line in a scene
+
+    X32 scenes keep all channel lines together, so bounding the regex scan
+    to this range skips the config, bus, fx and routing sections.
+    """
+    first = data.find(b'/ch/')
+    if first == -1:
+        return 0, 0
+    start = data.rfind(b'\n', 0, first) + 1
+    end = data.find(b'\n', data.rfind(b'/ch/'))
+    return start, len(data) if end == -1 else end
+
 def parse_scene_file(filepath):
     """Parse scene file and extract channel settings"""
     changes = []
     
     try:
-        with open(filepath, 'r') as f:
-            lines = f.readlines()
-        
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            
-            # Parse channel mix settings
-            if line.startswith('/ch/') and '/mix ' in line:
-                # Format: /ch/01/mix OFF  +8.1 ON +24 OFF   -oo
-                parts = line.split()
-                if len(parts) >= 3:
-                    channel = parts[0]  # /ch/01/mix
-                    mute_status = parts[1]  # OFF/ON
-                    fader_level = parts[2]  # +8.1
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return changes
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start, end = _channel_block(mm)
+                for match in _CH_MIX_RE.finditer(mm, start, end):
+                    channel_num = int(match.group(1))
+                    if channel_num < len(_ON_ADDR):
+                        mute_address = _ON_ADDR[channel_num]
+                        fader_address = _FADER_ADDR[channel_num]
+                    else:
+                        mute_address = f"/ch/{channel_num:02d}/mix/on"
+                        fader_address = f"/ch/{channel_num:02d}/mix/fader"
+                    
+                    # Mute status
+                    mute_value = match.group(2) == b"ON"
+                    changes.append(SceneChange("MUTE", channel_num, mute_address, mute_value))
                     
-                    # Convert to OSC commands
-                    if channel.startswith('/ch/') and channel.endswith('/mix'):
-                        channel_num = channel.split('/')[2]
-                        
-                        # Mute status
-                        mute_address = f"/ch/{channel_num}/mix/on"
-                        mute_value = mute_status == "ON"
-                        changes.append(("MUTE", channel_num, mute_address, mute_value))
-                        
-                        # Fader level
-                        try:
-                            fader_value = float(fader_level)
-                            fader_address = f"/ch/{channel_num}/mix/fader"
-                            changes.append(("FADER", channel_num, fader_address, fader_value))
-                        except ValueError:
-                            pass  # Skip if fader level is not a number
+                    # Fader level
+                    try:
+                        fader_value = float(match.group(3))
+                        changes.append(SceneChange("FADER", channel_num, fader_address, fader_value))
+                    except ValueError:
+                        pass  # Skip if fader level is not a number (e.g. -oo)
         
         return changes
         
@@ -98,8 +130,8 @@ def parse_scene_file(filepath):
         print(f"Error parsing scene file: {e}")
         return []
 
-def apply_scene_changes(ip_address, scene_file_path):
-    """Apply scene file changes to X32"""
+def _prepare_scene(scene_file_path):
+    """Parse, coalesce and encode a scene, returning (changes, messages)"""
     print(f"🎯 Applying scene changes from: {scene_file_path}")
     print("=" * 50)
     
@@ -108,29 +140,103 @@ def apply_scene_changes(ip_address, scene_file_path):
     
     if not changes:
         print("❌ No changes found in scene file")
-        return False
+        return None
+    
+    # Duplicate lines in a scene would otherwise send the same address twice
+    parsed_count = len(changes)
+    changes = coalesce_changes(changes)
     
     print(f"📋 Found {len(changes)} changes to apply")
+    if len(changes) < parsed_count:
+        print(f"🔁 Skipped {parsed_count - len(changes)} redundant changes")
+    
+    # Encode every change up front so the whole scene goes out in one batch
+    for change in changes:
+        print(f"🎛️  {change.action}: Channel {change.channel:02d} | {change.address} = {change.value}")
+    messages = create_osc_batch((change.address, change.value) for change in changes)
+    return changes, messages
+
+def apply_scene_changes(ip_address, scene_file_path, pace=0.0, bundle=False):
+    """Apply scene file changes to X32
+
+    By default the whole scene is sent as one burst; pass ``pace`` (seconds)
+    to space the messages out if a console is seen dropping packets.
+    ``bundle`` packs the messages into MTU-sized OSC #bundle datagrams.
+    """
+    prepared = _prepare_scene(scene_file_path)
+    if prepared is None:
+        return False
+    changes, messages = prepared
     
-    # Apply each change
     success_count = 0
-    for action, channel, address, value in changes:
-        print(f"🎛️  {action}: Channel {channel} | {address} = {value}")
-        
-        if send_osc_message(ip_address, 10023, address, value):
-            print(f"✅ Success")
-            success_count += 1
+    try:
+        sock = cached_socket(ip_address, 10023, sndbuf=BURST_SNDBUF, tune=True)
+        if pace > 0:
+            for message in messages:
+                sock.send(message)
+                success_count += 1
+                time.sleep(pace)
+        elif bundle:
+            # Count only the messages inside bundles the kernel accepted
+            groups = group_messages(messages)
+            sent = send_many(sock, [create_osc_bundle(group) for group in groups])
+            success_count = sum(len(group) for group in groups[:sent])
+            print(f"📦 Packed into {len(groups)} OSC bundles")
         else:
-            print(f"❌ Failed")
-        
-        time.sleep(0.1)  # Small delay between commands
+            success_count = send_many(sock, messages)
+        print(f"✅ Sent {success_count} OSC messages")
+    except Exception as e:
+        print(f"❌ Failed: {e}")
+    
+    print(f"\n🎯 Applied {success_count}/{len(changes)} changes successfully")
+    return success_count > 0
+
+async def apply_scene_changes_async(ip_address, scene_file_path, port=10023):
+    """Apply scene file changes to X32 from inside a running event loop
+
+    Every message is queued on an asyncio datagram transport in one tick and
+    the coroutine only yields until the transport has flushed its buffer, so
+    callers that already run an event loop are never blocked on the send.
+    """
+    prepared = _prepare_scene(scene_file_path)
+    if prepared is None:
+        return False
+    changes, messages = prepared
+    
+    success_count = 0
+    try:
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            asyncio.DatagramProtocol, remote_addr=(ip_address, port))
+        try:
+            for message in messages:
+                transport.sendto(message)
+                success_count += 1
+            # Anything the kernel refused is held by the transport; wait for it
+            while transport.get_write_buffer_size():
+                await asyncio.sleep(0.001)
+        finally:
+            transport.close()
+        print(f"✅ Sent {success_count} OSC messages")
+    except Exception as e:
+        print(f"❌ Failed: {e}")
     
     print(f"\n🎯 Applied {success_count}/{len(changes)} changes successfully")
     return success_count > 0
 
 if __name__ == "__main__":
-    ip_address = sys.argv[1] if len(sys.argv) > 1 else "192.168.1.116"
-    scene_file = sys.argv[2] if len(sys.argv) > 2 else "integrated.scn"
+    parser = argparse.ArgumentParser(description="Apply scene file changes to an X32 console")
+    parser.add_argument("ip_address", nargs="?", default="192.168.1.116")
+    parser.add_argument("scene_file", nargs="?", default="integrated.scn")
+    parser.add_argument("--pace", type=float, default=0.0,
+                        help="seconds to wait between messages (default: send as one burst)")
+    parser.add_argument("--bundle", action="store_true",
+                        help="pack messages into OSC #bundle datagrams")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="send through an asyncio datagram transport")
+    cli_args = parser.parse_args()
+    ip_address = cli_args.ip_address
+    scene_file = cli_args.scene_file
     
     print(f"🎛️  X32 Scene Change Application")
     print(f"IP: {ip_address}")
@@ -138,7 +244,12 @@ if __name__ == "__main__":
     print("=" * 50)
     
     # Apply changes
-    if apply_scene_changes(ip_address, scene_file):
+    if cli_args.use_async:
+        applied = asyncio.run(apply_scene_changes_async(ip_address, scene_file))
+    else:
+        applied = apply_scene_changes(ip_address, scene_file, cli_args.pace,
+                                      cli_args.bundle)
+    if applied:
         print("\n✅ Scene changes applied successfully!")
         print("📋 Check your X32 console for the changes")
     else:
@@ -51,11 +51,16 @@ def main():
     test_text.insert("1.0", "Debug log will appear here...\n")
     print("Text area created")
     
-    # Add some debug info
-    test_text.insert(tk.END, f"Python version: {os.sys.version}\n")
-    test_text.insert(tk.END, f"Tkinter version: {tk.TkVersion}\n")
-    test_text.insert(tk.END, f"Tcl version: {tk.TclVersion}\n")
-    test_text.insert(tk.END, "GUI should be visible now!\n")
+    # Add some debug info in a single insert
+    debug_lines = [
+        f"Python version: {os.sys.version}",
+        f"Tkinter version: {tk.TkVersion}",
+        f"Tcl version: {tk.TclVersion}",
+    ]
+    test_text.insert(tk.END, "\n".join(debug_lines) + "\n")
+    
+    # Only claim visibility once the event loop is actually running
+    root.after(0, lambda: test_text.insert(tk.END, "GUI should be visible now!\n"))
     
     print("All widgets created, starting mainloop...")
     root.mainloop()
@@ -3,49 +3,71 @@
 Extract OSC specifications from X32-OSC.pdf
 """
 
-import PyPDF2
+import pypdfium2 as pdfium
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
-def extract_pdf_text(pdf_path):
-    """Extract text from PDF file"""
+def _extract_page(pdf_path, index):
+    """Extract the text of one page (runs in a worker process)"""
+    pdf = pdfium.PdfDocument(pdf_path)
     try:
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            
-            print(f"PDF has {len(pdf_reader.pages)} pages")
-            
-            # Extract text from first few pages to understand structure
-            text = ""
-            for i, page in enumerate(pdf_reader.pages[:10]):  # First 10 pages
-                page_text = page.extract_text()
-                text += f"\n--- PAGE {i+1} ---\n"
-                text += page_text
-                text += "\n"
-                
-            return text
-            
+        return pdf[index].get_textpage().get_text_range()
+    finally:
+        pdf.close()
+
+def extract_pdf_text(pdf_path, output_file, max_pages=10, preview_chars=1000):
+    """Stream text from a PDF file into output_file page by page
+
+    Pages are decoded in parallel worker processes (PDFium is not
+    thread-safe) and written out in page order as they complete.
+
+    Returns (characters written, preview of the first characters), or None
+    on failure.
+    """
+    try:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            page_count = len(pdf)
+        finally:
+            pdf.close()
+        print(f"PDF has {page_count} pages")
+
+        # Extract text from first few pages to understand structure
+        pages = range(min(max_pages, page_count))
+
+        total = 0
+        preview = ""
+        with open(output_file, 'w', encoding='utf-8') as out, ProcessPoolExecutor() as executor:
+            for i, page_text in zip(pages, executor.map(_extract_page, repeat(pdf_path), pages)):
+                chunk = f"\n--- PAGE {i+1} ---\n{page_text}\n"
+                out.write(chunk)
+
+                total += len(chunk)
+                if len(preview) < preview_chars:
+                    preview += chunk[:preview_chars - len(preview)]
+
+        return total, preview
+
     except Exception as e:
         print(f"Error extracting text: {e}")
         return None
 
 if __name__ == "__main__":
     pdf_path = "X32-OSC.pdf"
-    
+    output_file = "X32_OSC_Specifications.txt"
+
     print("Extracting OSC specifications from X32-OSC.pdf...")
-    text = extract_pdf_text(pdf_path)
-    
-    if text:
-        # Save to text file
-        output_file = "X32_OSC_Specifications.txt"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(text)
-        
+    result = extract_pdf_text(pdf_path, output_file)
+
+    if result:
+        total, preview = result
         print(f"Extracted text saved to {output_file}")
-        print(f"Extracted {len(text)} characters")
-        
+        print(f"Extracted {total} characters")
+
         # Show first 1000 characters as preview
         print("\n--- PREVIEW ---")
-        print(text[:1000])
+        print(preview)
         print("...")
     else:
-        print("Failed to extract text from PDF") 
\ No newline at end of file
+        print("Failed to extract text from PDF")
@@ -3,51 +3,17 @@
 Move Will channel fader
 """
 
-import socket
-import struct
 import time
 import sys
 
-def create_osc_message(address, *args):
-    """Create OSC message"""
-    message = address.encode('utf-8')
-    message += b'\x00' * (4 - len(message) % 4)
-
-    type_tags = ','
-    for arg in args:
-        if isinstance(arg, bool):
-            type_tags += 'T' if arg else 'F'
-        elif isinstance(arg, int):
-            type_tags += 'i'
-        elif isinstance(arg, float):
-            type_tags += 'f'
-        elif isinstance(arg, str):
-            type_tags += 's'
-
-    message += type_tags.encode('utf-8')
-    message += b'\x00' * (4 - len(type_tags) % 4)
-
-    for arg in args:
-        if isinstance(arg, bool):
-            pass
-        elif isinstance(arg, int):
-            message += struct.pack('>i', arg)
-        elif isinstance(arg, float):
-            message += struct.pack('>f', arg)
-        elif isinstance(arg, str):
-            message += arg.encode('utf-8')
-            message += b'\x00' * (4 - len(arg.encode('utf-8')) % 4)
-
-    return message
+from osc_batch import cached_socket
+from osc_codec import create_osc_message
 
 def send_osc_message(ip_address, port, address, *args):
     """Send OSC message to X32"""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.settimeout(2)
         message = create_osc_message(address, *args)
-        sock.sendto(message, (ip_address, port))
-        sock.close()
+        cached_socket(ip_address, port).send(message)
         return True
     except Exception as e:
         print(f"Error sending OSC message: {e}")
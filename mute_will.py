@@ -3,28 +3,55 @@
 Quick script to mute the "Will" channel on X32 console with detailed logging
 """
 
+import atexit
 import socket
-import struct
 import sys
 import time
 import os
 from datetime import datetime
 
+from osc_batch import cached_socket
+from osc_codec import create_osc_message
+
+_log_fh = None
+_log_date = None
+
+def _get_log_fh(date):
+    """Return the open log file for a date, rolling over when the date changes"""
+    global _log_fh, _log_date
+    if _log_fh is None or date != _log_date:
+        _close_log_fh()
+        
+        # Create logs directory if it doesn't exist
+        if not os.path.exists("logs"):
+            os.makedirs("logs")
+        
+        _log_fh = open(f"logs/x32_changes_{date}.log", "a", buffering=1)
+        _log_date = date
+    return _log_fh
+
+def _close_log_fh():
+    """Close the cached log file, if any"""
+    global _log_fh
+    if _log_fh is not None:
+        _log_fh.close()
+        _log_fh = None
+
+atexit.register(_close_log_fh)
+
+_LOG_FMT = "[{}] {}: Channel {} | Address: {} | Value: {} | IP: {} | Status: {}\n".format
+
 def log_change(action, channel, address, value, ip_address, success=True):
     """Log changes to a file and print to console"""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    # Create logs directory if it doesn't exist
-    if not os.path.exists("logs"):
-        os.makedirs("logs")
-    
     # Log to file
-    log_file = f"logs/x32_changes_{datetime.now().strftime('%Y%m%d')}.log"
-    log_entry = f"[{timestamp}] {action}: Channel {channel} | Address: {address} | Value: {value} | IP: {ip_address} | Status: {'SUCCESS' if success else 'FAILED'}\n"
+    log_entry = _LOG_FMT(timestamp, action, channel, address, value, ip_address,
+                         'SUCCESS' if success else 'FAILED')
     
     try:
-        with open(log_file, "a") as f:
-            f.write(log_entry)
+        # Daily file name (YYYYMMDD) comes from the same timestamp
+        _get_log_fh(timestamp[:10].replace('-', '')).write(log_entry)
     except Exception as e:
         print(f"Warning: Could not write to log file: {e}")
     
@@ -32,43 +59,14 @@ def log_change(action, channel, address, value, ip_address, success=True):
     status_icon = "✅" if success else "❌"
     print(f"{status_icon} [{timestamp}] {action}: Channel {channel} | {address} = {value}")
 
-def create_osc_message(address, *args):
-    """Create OSC message"""
-    # OSC address
-    message = address.encode('utf-8')
-    message += b'\x00' * (4 - len(message) % 4)  # Pad to 4-byte boundary
-    
-    # OSC type tag string
-    type_tags = ','
-    for arg in args:
-        if isinstance(arg, bool):
-            type_tags += 'T' if arg else 'F'
-        elif isinstance(arg, int):
-            type_tags += 'i'
-        elif isinstance(arg, float):
-            type_tags += 'f'
-        elif isinstance(arg, str):
-            type_tags += 's'
-    
-    message += type_tags.encode('utf-8')
-    message += b'\x00' * (4 - len(type_tags) % 4)  # Pad to 4-byte boundary
-    
-    # OSC arguments
-    for arg in args:
-        if isinstance(arg, bool):
-            pass  # No data for boolean
-        elif isinstance(arg, int):
-            message += struct.pack('>i', arg)
-        elif isinstance(arg, float):
-            message += struct.pack('>f', arg)
-        elif isinstance(arg, str):
-            message += arg.encode('utf-8')
-            message += b'\x00' * (4 - len(arg.encode('utf-8')) % 4)  # Pad to 4-byte boundary
-    
-    return message
+# (ip, port) pairs that answered a probe; failures are always retried
+_reachable = set()
 
 def test_connection(ip_address, port=10023, timeout=2):
-    """Test if X32 console is reachable"""
+    """Test if X32 console is reachable (skipped once a probe has succeeded)"""
+    if (ip_address, port) in _reachable:
+        return True
+    
     print(f"🔍 Testing connection to X32 at {ip_address}:{port}...")
     
     try:
@@ -86,11 +84,13 @@ def test_connection(ip_address, port=10023, timeout=2):
             data, addr = sock.recvfrom(1024)
             print(f"✅ Received response from {addr}")
             sock.close()
+            _reachable.add((ip_address, port))
             return True
         except socket.timeout:
             # No response, but connection might still work
             print("⚠️  No response received, but connection may still work")
             sock.close()
+            _reachable.add((ip_address, port))
             return True
             
     except socket.error as e:
@@ -103,21 +103,46 @@ def test_connection(ip_address, port=10023, timeout=2):
 def send_osc_message(ip_address, port, address, *args):
     """Send OSC message to X32"""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.settimeout(2)
         message = create_osc_message(address, *args)
-        sock.sendto(message, (ip_address, port))
-        sock.close()
+        cached_socket(ip_address, port).send(message)
         return True
     except Exception as e:
         print(f"Error sending OSC message: {e}")
         return False
 
-def mute_channel(ip_address="192.168.1.116", port=10023, channel_name="Will"):
-    """Mute a specific channel by name with logging"""
+# "Will" is channel 1; "Will<N>" addresses channel N
+_CH_MAP = {f'Will{i}' if i else 'Will': f'/ch/{max(i, 1):02d}/mix/on' for i in range(0, 33)}
+
+def _set_channel_on(ip_address, port, channel_name, on):
+    """Send a mix on/off command for a named channel and log the result"""
+    action, verb = ("UNMUTE", "Unmuting") if on else ("MUTE", "Muting")
+    
+    address = _CH_MAP.get(channel_name)
+    if address is None:
+        print(f"❌ Channel '{channel_name}' not found in mappings")
+        print("Available mappings: Will, Will1 ... Will32")
+        return False
+    
+    channel_num = channel_name[len("Will"):] or "1"
+    
+    print(f"🎛️  {verb} {channel_name} at {address}")
+    if send_osc_message(ip_address, port, address, on):
+        log_change(action, channel_num, address, on, ip_address, True)
+        print(f"✅ Successfully sent {action.lower()} command for {channel_name}")
+        return True
+    else:
+        log_change(action, channel_num, address, on, ip_address, False)
+        print(f"❌ Failed to send {action.lower()} command for {channel_name}")
+        return False
+
+def mute_channel(ip_address="192.168.1.116", port=10023, channel_name="Will", probe=False):
+    """Mute a specific channel by name with logging
+
+    Pass ``probe=True`` to check the console answers before sending.
+    """
     
     # Test connection first
-    if not test_connection(ip_address, port):
+    if probe and not test_connection(ip_address, port):
         print("❌ Cannot connect to X32 console. Please check:")
         print("   - X32 console is powered on")
         print("   - Network connection is working")
@@ -125,126 +150,20 @@ def mute_channel(ip_address="192.168.1.116", port=10023, channel_name="Will"):
         print("   - X32 is configured for OSC on port 10023")
         return False
     
-    # Common channel mappings - you may need to adjust these
-    channel_mappings = {
-        "Will": "/ch/01/mix/on",  # Channel 1
-        "Will1": "/ch/01/mix/on",
-        "Will2": "/ch/02/mix/on", 
-        "Will3": "/ch/03/mix/on",
-        "Will4": "/ch/04/mix/on",
-        "Will5": "/ch/05/mix/on",
-        "Will6": "/ch/06/mix/on",
-        "Will7": "/ch/07/mix/on",
-        "Will8": "/ch/08/mix/on",
-        "Will9": "/ch/09/mix/on",
-        "Will10": "/ch/10/mix/on",
-        "Will11": "/ch/11/mix/on",
-        "Will12": "/ch/12/mix/on",
-        "Will13": "/ch/13/mix/on",
-        "Will14": "/ch/14/mix/on",
-        "Will15": "/ch/15/mix/on",
-        "Will16": "/ch/16/mix/on",
-    }
-    
-    # Try exact match first
-    if channel_name in channel_mappings:
-        address = channel_mappings[channel_name]
-        channel_num = channel_name.replace("Will", "")
-        if not channel_num:
-            channel_num = "1"
-        
-        print(f"🎛️  Muting {channel_name} at {address}")
-        if send_osc_message(ip_address, port, address, False):
-            log_change("MUTE", channel_num, address, False, ip_address, True)
-            print(f"✅ Successfully sent mute command for {channel_name}")
-            return True
-        else:
-            log_change("MUTE", channel_num, address, False, ip_address, False)
-            print(f"❌ Failed to send mute command for {channel_name}")
-            return False
-    
-    # Try numbered channels
-    for i in range(1, 33):
-        if f"Will{i}" == channel_name:
-            address = f"/ch/{i:02d}/mix/on"
-            print(f"🎛️  Muting {channel_name} at {address}")
-            if send_osc_message(ip_address, port, address, False):
-                log_change("MUTE", str(i), address, False, ip_address, True)
-                print(f"✅ Successfully sent mute command for {channel_name}")
-                return True
-            else:
-                log_change("MUTE", str(i), address, False, ip_address, False)
-                print(f"❌ Failed to send mute command for {channel_name}")
-                return False
-    
-    print(f"❌ Channel '{channel_name}' not found in mappings")
-    print("Available mappings:")
-    for name in channel_mappings.keys():
-        print(f"  - {name}")
-    return False
+    return _set_channel_on(ip_address, port, channel_name, False)
 
-def unmute_channel(ip_address="192.168.1.116", port=10023, channel_name="Will"):
-    """Unmute a specific channel by name with logging"""
+def unmute_channel(ip_address="192.168.1.116", port=10023, channel_name="Will", probe=False):
+    """Unmute a specific channel by name with logging
+
+    Pass ``probe=True`` to check the console answers before sending.
+    """
     
     # Test connection first
-    if not test_connection(ip_address, port):
+    if probe and not test_connection(ip_address, port):
         print("❌ Cannot connect to X32 console.")
         return False
     
-    # Common channel mappings
-    channel_mappings = {
-        "Will": "/ch/01/mix/on",  # Channel 1
-        "Will1": "/ch/01/mix/on",
-        "Will2": "/ch/02/mix/on", 
-        "Will3": "/ch/03/mix/on",
-        "Will4": "/ch/04/mix/on",
-        "Will5": "/ch/05/mix/on",
-        "Will6": "/ch/06/mix/on",
-        "Will7": "/ch/07/mix/on",
-        "Will8": "/ch/08/mix/on",
-        "Will9": "/ch/09/mix/on",
-        "Will10": "/ch/10/mix/on",
-        "Will11": "/ch/11/mix/on",
-        "Will12": "/ch/12/mix/on",
-        "Will13": "/ch/13/mix/on",
-        "Will14": "/ch/14/mix/on",
-        "Will15": "/ch/15/mix/on",
-        "Will16": "/ch/16/mix/on",
-    }
-    
-    # Try exact match first
-    if channel_name in channel_mappings:
-        address = channel_mappings[channel_name]
-        channel_num = channel_name.replace("Will", "")
-        if not channel_num:
-            channel_num = "1"
-        
-        print(f"🎛️  Unmuting {channel_name} at {address}")
-        if send_osc_message(ip_address, port, address, True):
-            log_change("UNMUTE", channel_num, address, True, ip_address, True)
-            print(f"✅ Successfully sent unmute command for {channel_name}")
-            return True
-        else:
-            log_change("UNMUTE", channel_num, address, True, ip_address, False)
-            print(f"❌ Failed to send unmute command for {channel_name}")
-            return False
-    
-    # Try numbered channels
-    for i in range(1, 33):
-        if f"Will{i}" == channel_name:
-            address = f"/ch/{i:02d}/mix/on"
-            print(f"🎛️  Unmuting {channel_name} at {address}")
-            if send_osc_message(ip_address, port, address, True):
-                log_change("UNMUTE", str(i), address, True, ip_address, True)
-                print(f"✅ Successfully sent unmute command for {channel_name}")
-                return True
-            else:
-                log_change("UNMUTE", str(i), address, True, ip_address, False)
-                print(f"❌ Failed to send unmute command for {channel_name}")
-                return False
-    
-    print(f"❌ Channel '{channel_name}' not found in mappings")
-    return False
+    return _set_channel_on(ip_address, port, channel_name, True)
 
 if __name__ == "__main__":
     # Get arguments from command line
@@ -264,9 +183,9 @@ if __name__ == "__main__":
     print("=" * 60)
     
     if action.lower() in ["mute", "m"]:
-        mute_channel(ip_address, 10023, channel_name)
+        mute_channel(ip_address, 10023, channel_name, probe=True)
     elif action.lower() in ["unmute", "u", "un"]:
-        unmute_channel(ip_address, 10023, channel_name)
+        unmute_channel(ip_address, 10023, channel_name, probe=True)
     else:
         print(f"❌ Unknown action: {action}")
         print("Valid actions: mute, unmute") 
\ No newline at end of file
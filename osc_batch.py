@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Batched OSC datagram sending and receiving for X32 scripts
+
+On Linux the whole burst is handed to the kernel with a single sendmmsg(2)
+call, and queued replies are read back with a single recvmmsg(2). Other
+platforms fall back to a sequential loop on one socket. cached_socket()
+gives every script one connected UDP socket per console for its lifetime.
+"""
+
+import atexit
+import ctypes
+import errno
+import os
+import socket
+import struct
+import sys
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", _MsgHdr),
+        ("msg_len", ctypes.c_uint),
+    ]
+
+
+def _load_libc(name, argtypes):
+    """Return a libc function, or None when it is unavailable"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = getattr(libc, name)
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = argtypes
+    func.restype = ctypes.c_int
+    return func
+
+
+_sendmmsg = _load_libc('sendmmsg', [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int])
+_recvmmsg = _load_libc('recvmmsg', [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int,
+                                    ctypes.c_void_p])
+
+# Linux constants the socket module does not export on every Python version
+_IP_MTU_DISCOVER = getattr(socket, 'IP_MTU_DISCOVER', 10)
+_IP_PMTUDISC_DONT = getattr(socket, 'IP_PMTUDISC_DONT', 0)
+_SO_PRIORITY = getattr(socket, 'SO_PRIORITY', 12)
+_MSG_DONTWAIT = getattr(socket, 'MSG_DONTWAIT', 0x40)
+_IPTOS_LOWDELAY = 0x10
+
+# Queue OSC control traffic ahead of bulk traffic in the local qdisc
+_OSC_PRIORITY = 6
+
+# SO_SNDBUF with room for a whole scene or --batch burst in the kernel queue
+BURST_SNDBUF = 1 << 20
+
+
+def tune_socket(sock):
+    """Apply Linux send-side options to a UDP socket
+
+    Path MTU discovery is turned off so a burst never fails with EMSGSIZE
+    mid-way, and packets are marked low-delay (IP_TOS) and given a high
+    SO_PRIORITY so console control is not queued behind bulk traffic.
+    """
+    if not sys.platform.startswith('linux'):
+        return
+    for level, option, value in (
+            (socket.IPPROTO_IP, _IP_MTU_DISCOVER, _IP_PMTUDISC_DONT),
+            (socket.IPPROTO_IP, socket.IP_TOS, _IPTOS_LOWDELAY),
+            (socket.SOL_SOCKET, _SO_PRIORITY, _OSC_PRIORITY)):
+        try:
+            sock.setsockopt(level, option, value)
+        except OSError:
+            pass
+
+
+_sockets = {}
+
+
+def cached_socket(ip_address, port, sndbuf=None, tune=False):
+    """Return a UDP socket connected to the X32, created once per address
+
+    ``sndbuf`` sets SO_SNDBUF and ``tune`` applies tune_socket(); both only
+    take effect when the socket is first created. Cached sockets are closed
+    at interpreter exit.
+    """
+    sock = _sockets.get((ip_address, port))
+    if sock is None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if sndbuf is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+        if tune:
+            tune_socket(sock)
+        sock.connect((ip_address, port))
+        _sockets[(ip_address, port)] = sock
+    return sock
+
+
+def _close_sockets():
+    """Close all cached sockets"""
+    for sock in _sockets.values():
+        sock.close()
+    _sockets.clear()
+
+
+atexit.register(_close_sockets)
+
+
+def _sockaddr_in(address):
+    """Build a raw struct sockaddr_in for an (ip, port) tuple"""
+    ip_address, port = address
+    return (struct.pack('=H', socket.AF_INET) + struct.pack('>H', port)
+            + socket.inet_aton(ip_address) + b'\x00' * 8)
+
+
+def _as_c_buffer(packet):
+    """Return a ctypes object aliasing a packet's memory, plus its length"""
+    if isinstance(packet, bytes):
+        return ctypes.c_char_p(packet), len(packet)
+    view = memoryview(packet)
+    if view.readonly or not view.c_contiguous:
+        data = view.tobytes()
+        return ctypes.c_char_p(data), len(data)
+    return (ctypes.c_char * view.nbytes).from_buffer(view), view.nbytes
+
+
+def send_many(sock, packets, address=None):
+    """Send a list of datagrams, returning how many were sent
+
+    Packets may be bytes or any contiguous buffer (e.g. memoryview slices of
+    one shared bytearray). ``address`` may be omitted when the socket is
+    already connected. If the socket stops accepting datagrams partway
+    (EAGAIN on a non-blocking socket, ENOBUFS) the short count is returned;
+    OSError is raised only when nothing was sent.
+    """
+    if not packets:
+        return 0
+
+    if _sendmmsg is None or sock.family != socket.AF_INET:
+        sent = 0
+        for packet in packets:
+            try:
+                if address is None:
+                    sock.send(packet)
+                else:
+                    sock.sendto(packet, address)
+            except OSError:
+                if sent:
+                    return sent
+                raise
+            sent += 1
+        return sent
+
+    count = len(packets)
+    iovecs = (_IOVec * count)()
+    msgs = (_MMsgHdr * count)()
+
+    name = None
+    if address is not None:
+        name = ctypes.create_string_buffer(_sockaddr_in(address), 16)
+
+    # Point each iovec straight at the caller's buffer; keep the refs alive
+    buffers = [_as_c_buffer(packet) for packet in packets]
+    for i, (buffer, length) in enumerate(buffers):
+        iovecs[i].iov_base = ctypes.cast(buffer, ctypes.c_void_p)
+        iovecs[i].iov_len = length
+        hdr = msgs[i].msg_hdr
+        hdr.msg_iov = ctypes.pointer(iovecs[i])
+        hdr.msg_iovlen = 1
+        if name is not None:
+            hdr.msg_name = ctypes.cast(name, ctypes.c_void_p)
+            hdr.msg_namelen = 16
+
+    base = ctypes.addressof(msgs)
+    stride = ctypes.sizeof(_MMsgHdr)
+    sent = 0
+    while sent < count:
+        result = _sendmmsg(sock.fileno(), base + sent * stride, count - sent, 0)
+        if result < 0:
+            if sent:
+                return sent
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        sent += result
+
+    return sent
+
+
+class BatchReceiver:
+    """Drain datagrams already queued on a socket into preallocated buffers
+
+    On Linux one recvmmsg(2) call reads up to ``count`` datagrams; elsewhere
+    nothing is drained and callers rely on their own blocking receive.
+    """
+
+    def __init__(self, sock, count=32, size=1500):
+        self.sock = sock
+        self._buffers = [bytearray(size) for _ in range(count)]
+        self._views = [memoryview(buffer) for buffer in self._buffers]
+        self._msgs = None
+        if _recvmmsg is None:
+            return
+
+        self._iovecs = (_IOVec * count)()
+        self._msgs = (_MMsgHdr * count)()
+        # Keep the ctypes aliases alive for as long as the headers point at them
+        self._c_buffers = [(ctypes.c_char * size).from_buffer(buffer) for buffer in self._buffers]
+        for i, c_buffer in enumerate(self._c_buffers):
+            self._iovecs[i].iov_base = ctypes.addressof(c_buffer)
+            self._iovecs[i].iov_len = size
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+
+    def drain(self):
+        """Return the datagrams queued on the socket without blocking"""
+        if self._msgs is None:
+            return []
+        result = _recvmmsg(self.sock.fileno(), self._msgs, len(self._buffers), _MSG_DONTWAIT, None)
+        if result < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return []
+            raise OSError(err, os.strerror(err))
+        msgs = self._msgs
+        views = self._views
+        return [views[i][:msgs[i].msg_len].tobytes() for i in range(result)]
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Shared OSC message encoder for X32 scripts
+
+Headers (padded address + type tags) are built once per address and
+cached, so the common single-bool, single-int and single-float messages
+cost one dictionary lookup and at most one struct pack.
+"""
+
+import functools
+import struct
+
+_PACK_F = struct.Struct('>f')
+_PACK_I = struct.Struct('>i')
+
+# Nul padding after a string of length n is _PADDING[n % 4]. OSC strings
+# must end in at least one nul, so an aligned string still gets 4 bytes.
+_PADDING = (b'\x00' * 4, b'\x00' * 3, b'\x00' * 2, b'\x00')
+
+@functools.lru_cache(maxsize=1024)
+def osc_header(address, type_tags):
+    """Return the padded address + type tag header for an OSC message"""
+    address = address.encode('utf-8')
+    type_tags = type_tags.encode('utf-8')
+    return b''.join((address, _PADDING[len(address) % 4],
+                     type_tags, _PADDING[len(type_tags) % 4]))
+
+def make_osc_b(address, value):
+    """Create an OSC message carrying a single boolean (no payload bytes)"""
+    return osc_header(address, ',T' if value else ',F')
+
+def make_osc_f(address, value):
+    """Create an OSC message carrying a single float"""
+    return osc_header(address, ',f') + _PACK_F.pack(value)
+
+def make_osc_i(address, value):
+    """Create an OSC message carrying a single int"""
+    return osc_header(address, ',i') + _PACK_I.pack(value)
+
+# Type tag per exact argument type; bool is resolved to T/F by value
+_TYPE_TAGS = {bool: 'T', int: 'i', float: 'f', str: 's'}
+_PACKERS = {int: _PACK_I.pack, float: _PACK_F.pack}
+
+def _arg_type(arg):
+    """Resolve a subclass argument (e.g. IntEnum) to the OSC type it encodes as"""
+    for kind in (bool, int, float, str):
+        if isinstance(arg, kind):
+            return kind
+    return None  # Unsupported types are skipped
+
+def create_osc_message(address, *args):
+    """Create OSC message"""
+    if len(args) == 1:
+        arg = args[0]
+        kind = type(arg)
+        if kind is bool:
+            return make_osc_b(address, arg)
+        if kind is int:
+            return make_osc_i(address, arg)
+        if kind is float:
+            return make_osc_f(address, arg)
+
+    # Collect the pieces and join once instead of re-copying on every +=
+    type_tags = [',']
+    parts = [None]  # Header goes first once the type tags are known
+
+    for arg in args:
+        kind = type(arg)
+        if kind not in _TYPE_TAGS:
+            kind = _arg_type(arg)
+            if kind is None:
+                continue
+        if kind is bool:
+            type_tags.append('T' if arg else 'F')
+            continue  # No data for boolean
+        type_tags.append(_TYPE_TAGS[kind])
+        if kind is str:
+            encoded = arg.encode('utf-8')
+            parts.append(encoded)
+            parts.append(_PADDING[len(encoded) % 4])
+        else:
+            parts.append(_PACKERS[kind](arg))
+
+    parts[0] = osc_header(address, ''.join(type_tags))
+    return b''.join(parts)
+
+_BUNDLE_TAG = b'#bundle\x00'
+_PACK_Q = struct.Struct('>Q')
+_PACK_SIZE = struct.Struct('>I')
+
+# Keep a bundle inside one Ethernet frame after IP/UDP headers
+BUNDLE_MAX_SIZE = 1400
+
+def create_osc_bundle(messages, timetag=1):
+    """Wrap encoded OSC messages in one #bundle datagram
+
+    A timetag of 1 means "execute immediately".
+    """
+    parts = [_BUNDLE_TAG, _PACK_Q.pack(timetag)]
+    for message in messages:
+        parts.append(_PACK_SIZE.pack(len(message)))
+        parts.append(message)
+    return b''.join(parts)
+
+def group_messages(messages, max_size=BUNDLE_MAX_SIZE):
+    """Split encoded OSC messages into runs that each fit one bundle of max_size"""
+    groups = []
+    group = []
+    size = 16  # '#bundle\0' + timetag
+    for message in messages:
+        needed = 4 + len(message)
+        if group and size + needed > max_size:
+            groups.append(group)
+            group = []
+            size = 16
+        group.append(message)
+        size += needed
+    if group:
+        groups.append(group)
+    return groups
+
+def bundle_messages(messages, max_size=BUNDLE_MAX_SIZE, timetag=1):
+    """Group encoded OSC messages into as few bundles as fit in max_size"""
+    return [create_osc_bundle(group, timetag) for group in group_messages(messages, max_size)]
@@ -3,57 +3,33 @@
 Simple command-line scene file monitor
 """
 
-import time
+import asyncio
 import os
 import socket
-import struct
 import hashlib
+import re
+import threading
 
-def create_osc_message(address, *args):
-    """Create OSC message"""
-    message = address.encode('utf-8')
-    message += b'\x00' * (4 - len(message) % 4)
-    
-    type_tags = ','
-    for arg in args:
-        if isinstance(arg, bool):
-            type_tags += 'T' if arg else 'F'
-        elif isinstance(arg, int):
-            type_tags += 'i'
-        elif isinstance(arg, float):
-            type_tags += 'f'
-        elif isinstance(arg, str):
-            type_tags += 's'
-    
-    message += type_tags.encode('utf-8')
-    message += b'\x00' * (4 - len(type_tags) % 4)
-    
-    for arg in args:
-        if isinstance(arg, bool):
-            pass
-        elif isinstance(arg, int):
-            message += struct.pack('>i', arg)
-        elif isinstance(arg, float):
-            message += struct.pack('>f', arg)
-        elif isinstance(arg, str):
-            message += arg.encode('utf-8')
-            message += b'\x00' * (4 - len(arg.encode('utf-8')) % 4)
-    
-    return message
+from osc_batch import BURST_SNDBUF, cached_socket, send_many
+from osc_codec import make_osc_f, make_osc_i
 
-def send_osc_command(ip_address, port, address, value):
-    """Send OSC command to X32"""
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        message = create_osc_message(address, value)
-        sock.sendto(message, (ip_address, port))
-        sock.close()
-        return True
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return False
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
-def transform_db_to_normalized(db_value):
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+
+# Addresses per channel, keyed by the number as written in the scene file,
+# so the reload path does no string formatting at all
+_CH_TABLE = {f"{ch:02d}": (f"/ch/{ch:02d}/mix/on", f"/ch/{ch:02d}/mix/fader")
+             for ch in range(1, 33)}
+
+def _db_to_normalized(db_value):
     """
     Transform scene file dB value to X32 normalized fader value
     Based on actual calibration data:
@@ -92,6 +68,289 @@ def transform_db_to_normalized(db_value):
                 slope = (0.563 - 0.75) / (5.0 - 0.0)
                 return 0.75 + slope * db_value
 
+# Scene files store fader levels in 0.1 dB steps, so every level a scene
+# can contain between -60 and +10 dB is precomputed once
+_FADER_LUT = {step / 10: _db_to_normalized(step / 10) for step in range(-600, 101)}
+
+def transform_db_to_normalized(db_value):
+    """Transform scene file dB value to X32 normalized fader value"""
+    normalized = _FADER_LUT.get(db_value)
+    if normalized is None:
+        normalized = _db_to_normalized(db_value)
+    return normalized
+
+# Format: /ch/01/mix OFF  +8.1 ON +24 OFF   -oo
+_MIX_RE = re.compile(rb'^[ \t]*(/ch/(\d+)/mix[ \t]+(\S+)[ \t]+(\S+)[^\r\n]*)', re.M)
+
+def parse_scene(data):
+    """Parse channel mix lines from raw scene file bytes
+
+    Returns (line_num, line, channel_num, mute_value, fader_level, fader_db)
+    for every /ch/NN/mix line; fader_db is None when the level is not a
+    number (e.g. -oo).
+    """
+    entries = []
+    line_num = 1
+    pos = 0
+    for match in _MIX_RE.finditer(data):
+        # Line numbers only for the lines that matched
+        line_num += data.count(b'\n', pos, match.start())
+        pos = match.start()
+        
+        fader_level = match.group(4).decode('utf-8', 'replace')
+        try:
+            fader_db = float(fader_level)
+        except ValueError:
+            fader_db = None
+        entries.append((line_num, match.group(1).decode('utf-8', 'replace').rstrip(),
+                        match.group(2).decode('ascii'),
+                        1 if match.group(3) == b"ON" else 0, fader_level, fader_db))
+    return entries
+
+def process_file(filepath, ip_address, port, data=None, state=None, send=None):
+    """Parse the scene file and send its channel settings to the X32
+
+    ``data`` is the file contents when the caller has already read them.
+    ``state`` maps channel number -> (mute, fader dB) as last sent; when
+    given, only channels whose settings changed are sent and it is updated.
+    ``send`` is called with the list of encoded packets and returns how many
+    went out; by default they go out through send_many on a cached blocking
+    socket. ``state`` is only updated once every packet has been sent.
+    """
+    print(f"🔄 File changed! Processing...")
+    
+    # Read and process the file
+    if data is None:
+        with open(filepath, 'rb') as f:
+            data = f.read()
+    
+    # Encode every command first, then send the scene as one burst
+    packets = []
+    new_state = {}
+    unchanged = 0
+    for line_num, line, channel_num, mute_value, fader_level, fader_value in parse_scene(data):
+        new_state[channel_num] = (mute_value, fader_value)
+        if state is not None and state.get(channel_num) == (mute_value, fader_value):
+            unchanged += 1
+            continue
+        
+        print(f"🎛️  Line {line_num}: {line}")
+        
+        # Convert to OSC commands
+        channel = _CH_TABLE.get(channel_num)
+        if channel is None and channel_num.isdigit():
+            channel = _CH_TABLE.get(f"{int(channel_num):02d}")  # e.g. "/ch/1/mix"
+        if channel is None:
+            channel = (f"/ch/{channel_num}/mix/on", f"/ch/{channel_num}/mix/fader")
+        mute_address, fader_address = channel
+        
+        # Mute command
+        print(f"   🔇 Mute: {mute_address} = {mute_value}")
+        packets.append(make_osc_i(mute_address, mute_value))
+        
+        # Fader command
+        if fader_value is None:
+            print(f"   ⚠️  Invalid fader level: {fader_level}")
+            continue
+        normalized_fader = transform_db_to_normalized(fader_value)
+        print(f"   🎚️  Fader: {fader_address} = {normalized_fader:.3f} (from {fader_value} dB)")
+        packets.append(make_osc_f(fader_address, normalized_fader))
+    
+    try:
+        if send is None:
+            sent = send_many(cached_socket(ip_address, port, sndbuf=BURST_SNDBUF), packets)
+        else:
+            sent = send(packets)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return
+    if sent < len(packets):
+        print(f"❌ Error: only {sent} of {len(packets)} commands sent")
+        return
+    
+    if state is not None:
+        state.clear()
+        state.update(new_state)
+        if unchanged:
+            print(f"⏭️  {unchanged} unchanged channels skipped")
+    print("✅ Changes applied!")
+    print()
+
+def content_digest(data):
+    """Fast non-cryptographic fingerprint of the scene file contents"""
+    if xxhash is not None:
+        return xxhash.xxh3_64(data).digest()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+class SceneFileWatcher:
+    """Tracks the scene file and applies it when its content changes"""
+    
+    def __init__(self, filepath, ip_address, port, send=None):
+        self.filepath = filepath
+        self.ip_address = ip_address
+        self.port = port
+        self.send = send
+        self.previous_stat = None
+        self.previous_hash = None
+        self.channel_state = {}
+        self.resend = False
+        self.lock = threading.Lock()
+    
+    def invalidate(self):
+        """Send every channel on the next change, not just the changed ones"""
+        self.resend = True  # Checked under the lock by check(); never blocks
+    
+    def check(self):
+        """Apply the scene file if it changed since the last check"""
+        with self.lock:
+            if self.resend:
+                self.resend = False
+                self.channel_state.clear()
+            try:
+                st = os.stat(self.filepath)
+            except FileNotFoundError:
+                return
+            
+            # Only re-hash when mtime or size moved; the hash then
+            # confirms the content really changed
+            file_sig = (st.st_mtime_ns, st.st_size)
+            if file_sig == self.previous_stat:
+                return
+            # Read once (unbuffered, sized from fstat) for both hash and parse
+            with open(self.filepath, 'rb', buffering=0) as f:
+                data = f.readall()
+            file_hash = content_digest(data)
+            self.previous_stat = file_sig
+            
+            if file_hash != self.previous_hash:
+                process_file(self.filepath, self.ip_address, self.port, data,
+                             self.channel_state, self.send)
+                self.previous_hash = file_hash
+
+if Observer is not None:
+    class SceneFileHandler(FileSystemEventHandler):
+        """Debounced file system event handler for the scene file"""
+        
+        def __init__(self, watcher, debounce_time=0.2, notify=None):
+            self.watcher = watcher
+            self.path = os.path.abspath(watcher.filepath)
+            self.debounce_time = debounce_time
+            self.notify = notify or watcher.check
+            self.timer = None
+        
+        def _schedule(self, path):
+            # Editors save in bursts; check once the burst has settled
+            if os.path.abspath(path) != self.path:
+                return
+            if self.timer is not None:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.debounce_time, self.notify)
+            self.timer.daemon = True
+            self.timer.start()
+        
+        def on_modified(self, event):
+            if not event.is_directory:
+                self._schedule(event.src_path)
+        
+        def on_created(self, event):
+            if not event.is_directory:
+                self._schedule(event.src_path)
+        
+        def on_moved(self, event):
+            # Atomic saves write a temp file and rename it over the scene
+            if not event.is_directory:
+                self._schedule(event.dest_path)
+
+class OscReplyProtocol(asyncio.DatagramProtocol):
+    """Prints the address of OSC replies from the X32 and reports socket errors"""
+    
+    def __init__(self, on_error=None):
+        self.on_error = on_error
+    
+    def datagram_received(self, data, addr):
+        address = data.split(b'\x00', 1)[0].decode('utf-8', 'replace')
+        print(f"📨 X32 reply: {address}")
+    
+    def error_received(self, exc):
+        # e.g. ICMP port unreachable: an earlier burst never reached the console
+        print(f"❌ X32 unreachable: {exc}")
+        if self.on_error is not None:
+            self.on_error()
+
+# How long a burst waits for a full send queue to drain
+_SEND_TIMEOUT = 1.0
+
+async def _send_burst(sock, packets):
+    """Send packets on the monitor's non-blocking socket, returning how many went out
+
+    Runs on the event loop, which owns the socket. The burst goes out with
+    send_many; if the send queue fills, the rest follow once it drains.
+    """
+    loop = asyncio.get_running_loop()
+    sent = 0
+    while sent < len(packets):
+        try:
+            sent += send_many(sock, packets[sent:])
+        except BlockingIOError:
+            pass  # Nothing went out this round
+        if sent == len(packets):
+            break
+        writable = loop.create_future()
+        loop.add_writer(sock, lambda: writable.done() or writable.set_result(None))
+        try:
+            await asyncio.wait_for(writable, _SEND_TIMEOUT)
+        except asyncio.TimeoutError:
+            break
+        finally:
+            loop.remove_writer(sock)
+    return sent
+
+async def monitor(filepath, ip_address, port):
+    """Apply the scene file whenever it changes, until cancelled"""
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+    
+    # Console replies arrive on the event loop; reading, hashing and parsing
+    # a scene run in a worker thread so they never block it. The socket is
+    # non-blocking and owned by the loop, so the worker hands each burst to
+    # the loop and waits for the result before recording the scene as sent
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, BURST_SNDBUF)
+    sock.connect((ip_address, port))
+    watcher = SceneFileWatcher(
+        filepath, ip_address, port,
+        send=lambda packets: asyncio.run_coroutine_threadsafe(
+            _send_burst(sock, packets), loop).result())
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: OscReplyProtocol(watcher.invalidate), sock=sock)
+    await loop.run_in_executor(None, watcher.check)
+    
+    observer = None
+    if Observer is not None:
+        observer = Observer()
+        handler = SceneFileHandler(watcher, notify=lambda: loop.call_soon_threadsafe(changed.set))
+        observer.schedule(handler, os.path.dirname(os.path.abspath(filepath)), recursive=False)
+        observer.start()
+    else:
+        print("⚠️  watchdog not installed - polling every second")
+    
+    try:
+        while True:
+            if observer is None:
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await changed.wait()
+            changed.clear()
+            await loop.run_in_executor(None, watcher.check)
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
+        transport.close()
+
 def main():
     ip_address = "192.168.1.116"
     port = 10023
@@ -103,64 +362,10 @@ def main():
     print("⏹️  Press Ctrl+C to stop")
     print()
     
-    previous_hash = None
-    
     try:
-        while True:
-            if os.path.exists(filepath):
-                # Calculate file hash
-                with open(filepath, 'rb') as f:
-                    file_hash = hashlib.md5(f.read()).hexdigest()
-                
-                # Check if file changed
-                if file_hash != previous_hash:
-                    print(f"🔄 File changed! Processing...")
-                    
-                    # Read and process the file
-                    with open(filepath, 'r') as f:
-                        lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        line = line.strip()
-                        
-                        # Parse channel mix settings
-                        if line.startswith('/ch/') and '/mix ' in line:
-                            parts = line.split()
-                            if len(parts) >= 3:
-                                channel = parts[0]  # /ch/01/mix
-                                mute_status = parts[1]  # OFF/ON
-                                fader_level = parts[2]  # +8.1
-                                
-                                print(f"🎛️  Line {line_num}: {line}")
-                                
-                                # Convert to OSC commands
-                                if channel.startswith('/ch/') and channel.endswith('/mix'):
-                                    channel_num = channel.split('/')[2]
-                                    
-                                    # Mute command
-                                    mute_address = f"/ch/{channel_num}/mix/on"
-                                    mute_value = 1 if mute_status == "ON" else 0
-                                    print(f"   🔇 Mute: {mute_address} = {mute_value}")
-                                    send_osc_command(ip_address, port, mute_address, mute_value)
-                                    
-                                    # Fader command
-                                    try:
-                                        fader_value = float(fader_level)
-                                        normalized_fader = transform_db_to_normalized(fader_value)
-                                        fader_address = f"/ch/{channel_num}/mix/fader"
-                                        print(f"   🎚️  Fader: {fader_address} = {normalized_fader:.3f} (from {fader_value} dB)")
-                                        send_osc_command(ip_address, port, fader_address, normalized_fader)
-                                    except ValueError:
-                                        print(f"   ⚠️  Invalid fader level: {fader_level}")
-                    
-                    previous_hash = file_hash
-                    print("✅ Changes applied!")
-                    print()
-            
-            time.sleep(1)  # Check every second
-            
+        asyncio.run(monitor(filepath, ip_address, port))
     except KeyboardInterrupt:
         print("\n⏹️  Monitoring stopped")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
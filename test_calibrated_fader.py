@@ -3,40 +3,20 @@
 Test calibrated fader transformation
 """
 
-import socket
-import struct
+from osc_batch import cached_socket
+from osc_codec import create_osc_message
 
-def create_osc_message(address, *args):
-    """Create OSC message"""
-    message = address.encode('utf-8')
-    message += b'\x00' * (4 - len(message) % 4)
-    
-    type_tags = ','
-    for arg in args:
-        if isinstance(arg, bool):
-            type_tags += 'T' if arg else 'F'
-        elif isinstance(arg, int):
-            type_tags += 'i'
-        elif isinstance(arg, float):
-            type_tags += 'f'
-        elif isinstance(arg, str):
-            type_tags += 's'
-    
-    message += type_tags.encode('utf-8')
-    message += b'\x00' * (4 - len(type_tags) % 4)
-    
-    for arg in args:
-        if isinstance(arg, bool):
-            pass
-        elif isinstance(arg, int):
-            message += struct.pack('>i', arg)
-        elif isinstance(arg, float):
-            message += struct.pack('>f', arg)
-        elif isinstance(arg, str):
-            message += arg.encode('utf-8')
-            message += b'\x00' * (4 - len(arg.encode('utf-8')) % 4)
-    
-    return message
+# Map scene file dB to console dB
+# +5.0 dB scene → -7.5 dB console
+# 0.0 dB scene → -24.7 dB console
+_SCENE_DB1, _CONSOLE_DB1 = 5.0, -7.5
+_SCENE_DB2, _CONSOLE_DB2 = 0.0, -24.7
+_SLOPE = (_CONSOLE_DB2 - _CONSOLE_DB1) / (_SCENE_DB2 - _SCENE_DB1)
+_INTERCEPT = _CONSOLE_DB1 - _SLOPE * _SCENE_DB1
+
+# Linear gain range mapped onto 0.0-1.0
+_LINEAR_MIN = 0.001
+_LINEAR_SPAN = 3.16 - 0.001
 
 def transform_db_to_x32_fader(db_value):
     """
@@ -46,20 +26,7 @@ def transform_db_to_x32_fader(db_value):
     """
     # Based on the calibration data, it seems the X32 expects
     # a different range. Let me try a simple linear mapping:
-    
-    # Map scene file dB to console dB
-    # +5.0 dB scene → -7.5 dB console
-    # 0.0 dB scene → -24.7 dB console
-    
-    # Calculate the slope and intercept
-    scene_db1, console_db1 = 5.0, -7.5
-    scene_db2, console_db2 = 0.0, -24.7
-    
-    slope = (console_db2 - console_db1) / (scene_db2 - scene_db1)
-    intercept = console_db1 - slope * scene_db1
-    
-    # Apply the transformation
-    console_db = slope * db_value + intercept
+    console_db = _SLOPE * db_value + _INTERCEPT
     
     # Convert console dB to normalized (assuming -60 to +10 range)
     if console_db <= -60:
@@ -70,16 +37,14 @@ def transform_db_to_x32_fader(db_value):
         # Convert dB to linear: 10^(dB/20)
         linear = 10 ** (console_db / 20.0)
         # Normalize to 0.0-1.0 range
-        normalized = (linear - 0.001) / (3.16 - 0.001)
+        normalized = (linear - _LINEAR_MIN) / _LINEAR_SPAN
         return max(0.0, min(1.0, normalized))
 
 def send_osc_command(ip_address, port, address, value):
     """Send OSC command to X32"""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         message = create_osc_message(address, value)
-        sock.sendto(message, (ip_address, port))
-        sock.close()
+        cached_socket(ip_address, port).send(message)
         return True
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -3,40 +3,21 @@
 Final calibrated fader transformation
 """
 
-import socket
-import struct
+from osc_batch import cached_socket
+from osc_codec import create_osc_message
 
-def create_osc_message(address, *args):
-    """Create OSC message"""
-    message = address.encode('utf-8')
-    message += b'\x00' * (4 - len(message) % 4)
-    
-    type_tags = ','
-    for arg in args:
-        if isinstance(arg, bool):
-            type_tags += 'T' if arg else 'F'
-        elif isinstance(arg, int):
-            type_tags += 'i'
-        elif isinstance(arg, float):
-            type_tags += 'f'
-        elif isinstance(arg, str):
-            type_tags += 's'
-    
-    message += type_tags.encode('utf-8')
-    message += b'\x00' * (4 - len(type_tags) % 4)
-    
-    for arg in args:
-        if isinstance(arg, bool):
-            pass
-        elif isinstance(arg, int):
-            message += struct.pack('>i', arg)
-        elif isinstance(arg, float):
-            message += struct.pack('>f', arg)
-        elif isinstance(arg, str):
-            message += arg.encode('utf-8')
-            message += b'\x00' * (4 - len(arg.encode('utf-8')) % 4)
-    
-    return message
+# Map scene dB to console dB first
+_SCENE_DB1, _CONSOLE_DB1 = 0.0, -24.7  # 0.5 normalized
+_SCENE_DB2, _CONSOLE_DB2 = 5.0, -7.5   # 0.563 normalized
+_SCENE_TO_CONSOLE_SLOPE = (_CONSOLE_DB2 - _CONSOLE_DB1) / (_SCENE_DB2 - _SCENE_DB1)
+_SCENE_TO_CONSOLE_INTERCEPT = _CONSOLE_DB1 - _SCENE_TO_CONSOLE_SLOPE * _SCENE_DB1
+
+# Now map console dB to normalized
+# console -24.7 dB → 0.5 normalized
+# console -2.0 dB → 0.7 normalized
+# console 0.0 dB → 0.7176 normalized
+_CONSOLE_TO_NORMALIZED_SLOPE = (0.7 - 0.5) / (-2.0 - (-24.7))
+_CONSOLE_TO_NORMALIZED_INTERCEPT = 0.5 - _CONSOLE_TO_NORMALIZED_SLOPE * (-24.7)
 
 def transform_db_to_x32_fader(db_value):
     """
@@ -62,41 +43,16 @@ def transform_db_to_x32_fader(db_value):
     # For 0.0 dB console (unity gain), we need:
     # normalized = 0.7 + (2.0 * (0.7 - 0.5) / 22.7) = 0.7176
     
-    unity_normalized = 0.7176
-    
-    # Now map scene file dB to this normalized range
-    # Scene file 0.0 dB should map to unity gain (0.0 dB console)
-    # Scene file +5.0 dB should map to -7.5 dB console
-    
-    # Calculate the slope for scene dB to normalized
-    scene_db1, console_db1 = 0.0, -24.7  # 0.5 normalized
-    scene_db2, console_db2 = 5.0, -7.5   # 0.563 normalized
-    
-    # Map scene dB to console dB first
-    scene_to_console_slope = (console_db2 - console_db1) / (scene_db2 - scene_db1)
-    scene_to_console_intercept = console_db1 - scene_to_console_slope * scene_db1
-    
-    console_db = scene_to_console_slope * db_value + scene_to_console_intercept
-    
-    # Now map console dB to normalized
-    # console -24.7 dB → 0.5 normalized
-    # console -2.0 dB → 0.7 normalized
-    # console 0.0 dB → 0.7176 normalized
-    
-    console_to_normalized_slope = (0.7 - 0.5) / (-2.0 - (-24.7))
-    console_to_normalized_intercept = 0.5 - console_to_normalized_slope * (-24.7)
-    
-    normalized = console_to_normalized_slope * console_db + console_to_normalized_intercept
+    console_db = _SCENE_TO_CONSOLE_SLOPE * db_value + _SCENE_TO_CONSOLE_INTERCEPT
+    normalized = _CONSOLE_TO_NORMALIZED_SLOPE * console_db + _CONSOLE_TO_NORMALIZED_INTERCEPT
     
-    return max(0.0, min(1.0, normalized))
+    return 0.0 if normalized <= 0.0 else 1.0 if normalized > 1.0 else normalized
 
 def send_osc_command(ip_address, port, address, value):
     """Send OSC command to X32"""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         message = create_osc_message(address, value)
-        sock.sendto(message, (ip_address, port))
-        sock.close()
+        cached_socket(ip_address, port).send(message)
         return True
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -3,48 +3,13 @@
 Test known working fader values
 """
 
-import socket
-import struct
+from osc_batch import cached_socket
+from osc_codec import make_osc_f
 
-def create_osc_message(address, *args):
-    """Create OSC message"""
-    message = address.encode('utf-8')
-    message += b'\x00' * (4 - len(message) % 4)
-    
-    type_tags = ','
-    for arg in args:
-        if isinstance(arg, bool):
-            type_tags += 'T' if arg else 'F'
-        elif isinstance(arg, int):
-            type_tags += 'i'
-        elif isinstance(arg, float):
-            type_tags += 'f'
-        elif isinstance(arg, str):
-            type_tags += 's'
-    
-    message += type_tags.encode('utf-8')
-    message += b'\x00' * (4 - len(type_tags) % 4)
-    
-    for arg in args:
-        if isinstance(arg, bool):
-            pass
-        elif isinstance(arg, int):
-            message += struct.pack('>i', arg)
-        elif isinstance(arg, float):
-            message += struct.pack('>f', arg)
-        elif isinstance(arg, str):
-            message += arg.encode('utf-8')
-            message += b'\x00' * (4 - len(arg.encode('utf-8')) % 4)
-    
-    return message
-
-def send_osc_command(ip_address, port, address, value):
-    """Send OSC command to X32"""
+def _send_packet(ip_address, port, message):
+    """Send an encoded OSC packet to X32"""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        message = create_osc_message(address, value)
-        sock.sendto(message, (ip_address, port))
-        sock.close()
+        cached_socket(ip_address, port).send(message)
         return True
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -61,9 +26,12 @@ def main():
     print(f"🎯 Target: {ip_address}:{port}")
     print()
     
-    for i, value in enumerate(test_values):
+    # Encode the whole sweep up front; each step is then a single send
+    packets = [make_osc_f("/ch/01/mix/fader", value) for value in test_values]
+    
+    for i, (value, packet) in enumerate(zip(test_values, packets)):
         print(f"Test {i+1}: Sending {value:.1f}")
-        success = send_osc_command(ip_address, port, "/ch/01/mix/fader", value)
+        success = _send_packet(ip_address, port, packet)
         if success:
             print(f"✅ Sent {value:.1f}")
         else:
@@ -3,52 +3,19 @@
 Test different mute address variations for X32
 """
 
-import socket
-import struct
+import argparse
 import time
 
-def create_osc_message(address, *args):
-    """Create OSC message"""
-    message = address.encode('utf-8')
-    message += b'\x00' * (4 - len(message) % 4)
-    
-    type_tags = ','
-    for arg in args:
-        if isinstance(arg, bool):
-            type_tags += 'T' if arg else 'F'
-        elif isinstance(arg, int):
-            type_tags += 'i'
-        elif isinstance(arg, float):
-            type_tags += 'f'
-        elif isinstance(arg, str):
-            type_tags += 's'
-    
-    message += type_tags.encode('utf-8')
-    message += b'\x00' * (4 - len(type_tags) % 4)
-    
-    for arg in args:
-        if isinstance(arg, bool):
-            pass
-        elif isinstance(arg, int):
-            message += struct.pack('>i', arg)
-        elif isinstance(arg, float):
-            message += struct.pack('>f', arg)
-        elif isinstance(arg, str):
-            message += arg.encode('utf-8')
-            message += b'\x00' * (4 - len(arg.encode('utf-8')) % 4)
-    
-    return message
+from osc_batch import BURST_SNDBUF, cached_socket, send_many
+from osc_codec import create_osc_message
 
 def send_osc_command(ip_address, port, address, value):
     """Send OSC command to X32"""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        
         print(f"🎛️  Sending: {address} = {value}")
         
         message = create_osc_message(address, value)
-        sock.sendto(message, (ip_address, port))
-        sock.close()
+        cached_socket(ip_address, port, sndbuf=BURST_SNDBUF).send(message)
         
         print(f"✅ Command sent successfully!")
         return True
@@ -57,7 +24,7 @@ def send_osc_command(ip_address, port, address, value):
         print(f"❌ Error: {e}")
         return False
 
-def main():
+def main(batch=False, delay=2.0):
     ip_address = "192.168.1.116"
     port = 10023
     
@@ -78,18 +45,33 @@ def main():
         ("Alternative address 6", "/ch/01/mute", False),
     ]
     
-    for name, address, value in mute_addresses:
-        print(f"🔧 {name}...")
-        success = send_osc_command(ip_address, port, address, value)
-        if success:
-            print(f"✅ {name} command sent")
-        else:
-            print(f"❌ {name} command failed")
+    if batch or delay <= 0:
+        messages = [create_osc_message(address, value) for _, address, value in mute_addresses]
+        try:
+            sent = send_many(cached_socket(ip_address, port, sndbuf=BURST_SNDBUF), messages)
+            print(f"✅ Sent {sent} mute commands in one batch")
+        except Exception as e:
+            print(f"❌ Batch send failed: {e}")
         print()
-        time.sleep(2)  # Longer delay to see effects
+    else:
+        for name, address, value in mute_addresses:
+            print(f"🔧 {name}...")
+            success = send_osc_command(ip_address, port, address, value)
+            if success:
+                print(f"✅ {name} command sent")
+            else:
+                print(f"❌ {name} command failed")
+            print()
+            time.sleep(delay)  # Longer delay to see effects
     
     print("🎯 All mute address tests completed!")
     print("💡 Check your X32 console - one of these should have worked!")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Test different mute address variations on an X32")
+    parser.add_argument("--batch", action="store_true",
+                        help="send every command in one burst instead of pacing them")
+    parser.add_argument("--delay", type=float, default=2.0,
+                        help="seconds to wait between commands (0 sends one batch)")
+    cli_args = parser.parse_args()
+    main(cli_args.batch, cli_args.delay)
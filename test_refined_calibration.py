@@ -3,40 +3,16 @@
 Refined calibrated fader transformation
 """
 
-import socket
-import struct
+from osc_batch import cached_socket
+from osc_codec import create_osc_message
 
-def create_osc_message(address, *args):
-    """Create OSC message"""
-    message = address.encode('utf-8')
-    message += b'\x00' * (4 - len(message) % 4)
-    
-    type_tags = ','
-    for arg in args:
-        if isinstance(arg, bool):
-            type_tags += 'T' if arg else 'F'
-        elif isinstance(arg, int):
-            type_tags += 'i'
-        elif isinstance(arg, float):
-            type_tags += 'f'
-        elif isinstance(arg, str):
-            type_tags += 's'
-    
-    message += type_tags.encode('utf-8')
-    message += b'\x00' * (4 - len(type_tags) % 4)
-    
-    for arg in args:
-        if isinstance(arg, bool):
-            pass
-        elif isinstance(arg, int):
-            message += struct.pack('>i', arg)
-        elif isinstance(arg, float):
-            message += struct.pack('>f', arg)
-        elif isinstance(arg, str):
-            message += arg.encode('utf-8')
-            message += b'\x00' * (4 - len(arg.encode('utf-8')) % 4)
-    
-    return message
+# Map scene dB to normalized using our calibration
+# 0.0 dB scene → 0.75 normalized (estimated for 0.0 dB console)
+# +5.0 dB scene → 0.563 normalized (known to give -7.5 dB console)
+_SCENE_DB1, _NORMALIZED1 = 0.0, 0.75  # estimated for unity gain
+_SCENE_DB2, _NORMALIZED2 = 5.0, 0.563  # known working value
+_SLOPE = (_NORMALIZED2 - _NORMALIZED1) / (_SCENE_DB2 - _SCENE_DB1)
+_INTERCEPT = _NORMALIZED1 - _SLOPE * _SCENE_DB1
 
 def transform_db_to_x32_fader(db_value):
     """
@@ -74,27 +50,14 @@ def transform_db_to_x32_fader(db_value):
     elif db_value >= 10:
         return 1.0
     else:
-        # Map scene dB to normalized using our calibration
-        # 0.0 dB scene → 0.75 normalized (estimated for 0.0 dB console)
-        # +5.0 dB scene → 0.563 normalized (known to give -7.5 dB console)
-        
-        # Calculate the slope
-        scene_db1, normalized1 = 0.0, 0.75  # estimated for unity gain
-        scene_db2, normalized2 = 5.0, 0.563  # known working value
-        
-        slope = (normalized2 - normalized1) / (scene_db2 - scene_db1)
-        intercept = normalized1 - slope * scene_db1
-        
-        normalized = slope * db_value + intercept
+        normalized = _SLOPE * db_value + _INTERCEPT
         return max(0.0, min(1.0, normalized))
 
 def send_osc_command(ip_address, port, address, value):
     """Send OSC command to X32"""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         message = create_osc_message(address, value)
-        sock.sendto(message, (ip_address, port))
-        sock.close()
+        cached_socket(ip_address, port).send(message)
         return True
     except Exception as e:
         print(f"❌ Error: {e}")
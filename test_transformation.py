@@ -3,33 +3,39 @@
 Test the dB to normalized transformation
 """
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def transform_db_to_normalized(db_value):
     """Transform dB value to normalized 0.0-1.0 range for X32"""
-    try:
-        # Convert dB to linear scale, then normalize
-        # dB range is typically -60 to +10, normalize to 0.0-1.0
-        if db_value <= -60:
-            return 0.0
-        elif db_value >= 10:
-            return 1.0
-        else:
-            # Convert dB to linear: 10^(dB/20)
-            linear = 10 ** (db_value / 20.0)
-            # Normalize to 0.0-1.0 range
-            # -60dB = 0.001 linear = 0.0 normalized
-            # 0dB = 1.0 linear = 0.5 normalized  
-            # +10dB = 3.16 linear = 1.0 normalized
-            normalized = (linear - 0.001) / (3.16 - 0.001)
-            return max(0.0, min(1.0, normalized))
-    except:
-        # Fallback to simple mapping
-        if db_value <= -60:
-            return 0.0
-        elif db_value >= 10:
-            return 1.0
-        else:
-            # Simple linear mapping
-            return (db_value + 60) / 70.0
+    # Convert dB to linear scale, then normalize
+    # dB range is typically -60 to +10, normalize to 0.0-1.0
+    if db_value <= -60:
+        return 0.0
+    elif db_value >= 10:
+        return 1.0
+    else:
+        # Convert dB to linear: 10^(dB/20)
+        linear = 10 ** (db_value / 20.0)
+        # Normalize to 0.0-1.0 range
+        # -60dB = 0.001 linear = 0.0 normalized
+        # 0dB = 1.0 linear = 0.5 normalized  
+        # +10dB = 3.16 linear = 1.0 normalized
+        normalized = (linear - 0.001) / (3.16 - 0.001)
+        return max(0.0, min(1.0, normalized))
+
+def transform_db_values_to_normalized(db_values):
+    """Transform a sequence of dB values, vectorized when NumPy is available"""
+    if np is None:
+        return [transform_db_to_normalized(db) for db in db_values]
+    
+    db = np.asarray(db_values, dtype=np.float64)
+    # Clip first so out-of-range values cannot overflow the power
+    linear = np.power(10.0, np.clip(db, -60.0, 10.0) / 20.0)
+    normalized = np.clip((linear - 0.001) / (3.16 - 0.001), 0.0, 1.0)
+    return np.where(db <= -60, 0.0, np.where(db >= 10, 1.0, normalized)).tolist()
 
 def main():
     print("🧪 Testing dB to normalized transformation...")
@@ -40,8 +46,7 @@ def main():
         -60.0, -40.0, -20.0, -10.0, -5.0, 0.0, 5.0, 10.0
     ]
     
-    for db in test_values:
-        normalized = transform_db_to_normalized(db)
+    for db, normalized in zip(test_values, transform_db_values_to_normalized(test_values)):
         print(f"📊 {db:+6.1f} dB → {normalized:.3f} normalized")
     
     print()
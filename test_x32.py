@@ -3,62 +3,58 @@
 Test script to verify X32 OSC communication
 """
 
-import socket
-import struct
-import sys
+import argparse
 import time
 
-def create_osc_message(address, *args):
-    """Create OSC message"""
-    message = address.encode('utf-8')
-    message += b'\x00' * (4 - len(message) % 4)
-    
-    type_tags = ','
-    for arg in args:
-        if isinstance(arg, bool):
-            type_tags += 'T' if arg else 'F'
-        elif isinstance(arg, int):
-            type_tags += 'i'
-        elif isinstance(arg, float):
-            type_tags += 'f'
-        elif isinstance(arg, str):
-            type_tags += 's'
-    
-    message += type_tags.encode('utf-8')
-    message += b'\x00' * (4 - len(type_tags) % 4)
-    
-    for arg in args:
-        if isinstance(arg, bool):
-            pass
-        elif isinstance(arg, int):
-            message += struct.pack('>i', arg)
-        elif isinstance(arg, float):
-            message += struct.pack('>f', arg)
-        elif isinstance(arg, str):
-            message += arg.encode('utf-8')
-            message += b'\x00' * (4 - len(arg.encode('utf-8')) % 4)
-    
-    return message
+from osc_batch import BURST_SNDBUF, cached_socket, send_many
+from osc_codec import create_osc_message
 
 def send_osc_message(ip_address, port, address, *args):
     """Send OSC message to X32"""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.settimeout(2)
         message = create_osc_message(address, *args)
-        sock.sendto(message, (ip_address, port))
-        sock.close()
+        cached_socket(ip_address, port, sndbuf=BURST_SNDBUF, tune=True).send(message)
         return True
     except Exception as e:
         print(f"Error sending OSC message: {e}")
         return False
 
-def test_x32_commands(ip_address="192.168.1.100", port=10023):
-    """Test various X32 OSC commands"""
+# The test sequence: console info, fader down and back, mute and unmute
+_TEST_COMMANDS = [
+    ("/xinfo", ""),
+    ("/ch/01/mix/fader", -20.0),
+    ("/ch/01/mix/fader", 0.0),
+    ("/ch/01/mix/on", False),
+    ("/ch/01/mix/on", True),
+]
+
+def test_x32_commands(ip_address="192.168.1.100", port=10023, batch=False):
+    """Test various X32 OSC commands
+
+    With ``batch`` the whole sequence goes out in one send_many() burst
+    instead of one paced command at a time.
+    """
     
     print(f"🧪 Testing X32 OSC commands at {ip_address}:{port}")
     print("=" * 50)
     
+    if batch:
+        messages = [create_osc_message(address, value) for address, value in _TEST_COMMANDS]
+        try:
+            sent = send_many(cached_socket(ip_address, port, sndbuf=BURST_SNDBUF, tune=True), messages)
+            print(f"✅ Sent {sent} test commands in one batch")
+        except Exception as e:
+            print(f"❌ Batch send failed: {e}")
+    else:
+        _run_paced_commands(ip_address, port)
+    
+    print("\n🎯 Test completed! Check your X32 console for:")
+    print("   - Channel 1 fader moving to -20dB then back to 0dB")
+    print("   - Channel 1 mute button toggling on/off")
+    print("   - Any error messages on the X32 screen")
+
+def _run_paced_commands(ip_address, port):
+    """Send the test sequence one command at a time with pauses to watch"""
     # Test 1: Get console info
     print("1. Testing console info request...")
     if send_osc_message(ip_address, port, "/xinfo", ""):
@@ -101,12 +97,11 @@ def test_x32_commands(ip_address="192.168.1.100", port=10023):
         print("   ✅ Sent unmute command (channel 1 should be unmuted)")
     else:
         print("   ❌ Failed to send unmute command")
-    
-    print("\n🎯 Test completed! Check your X32 console for:")
-    print("   - Channel 1 fader moving to -20dB then back to 0dB")
-    print("   - Channel 1 mute button toggling on/off")
-    print("   - Any error messages on the X32 screen")
 
 if __name__ == "__main__":
-    ip_address = sys.argv[1] if len(sys.argv) > 1 else "192.168.1.100"
-    test_x32_commands(ip_address, 10023) 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Test X32 OSC communication")
+    parser.add_argument("ip_address", nargs="?", default="192.168.1.100")
+    parser.add_argument("--batch", action="store_true",
+                        help="send every command in one burst instead of pacing them")
+    cli_args = parser.parse_args()
+    test_x32_commands(cli_args.ip_address, 10023, cli_args.batch) 
\ No newline at end of file
@@ -7,14 +7,48 @@ Enhanced version with scene management, EQ controls, and effects
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import socket
+import select
+import selectors
 import threading
+import collections
 import time
 import json
-import struct
 import os
 from typing import Dict, Any, Optional, List
 import queue
 
+from osc_batch import BatchReceiver, send_many
+from osc_codec import create_osc_bundle, create_osc_message, group_messages
+
+_CH_FADER = "/ch/{:02d}/mix/fader"
+_CH_ON = "/ch/{:02d}/mix/on"
+_CH_PAN = "/ch/{:02d}/mix/pan"
+_CH_NAME = "/ch/{:02d}/config/name"
+_BUS_FADER = "/bus/{:02d}/mix/fader"
+_BUS_ON = "/bus/{:02d}/mix/on"
+_BUS_NAME = "/bus/{:02d}/config/name"
+_MAIN_FADER = "/main/st/mix/fader"
+_SCENE_NAME = "/-ssn/{:03d}/config/name"
+
+# X32 addresses for channels 1-32, buses 1-16 and scenes 0-99, indexed by number
+_CH_FADER_ADDR = [_CH_FADER.format(i) for i in range(33)]
+_CH_ON_ADDR = [_CH_ON.format(i) for i in range(33)]
+_CH_PAN_ADDR = [_CH_PAN.format(i) for i in range(33)]
+_CH_NAME_ADDR = [_CH_NAME.format(i) for i in range(33)]
+_BUS_FADER_ADDR = [_BUS_FADER.format(i) for i in range(17)]
+_BUS_ON_ADDR = [_BUS_ON.format(i) for i in range(17)]
+_BUS_NAME_ADDR = [_BUS_NAME.format(i) for i in range(17)]
+_SCENE_NAME_ADDR = [_SCENE_NAME.format(i) for i in range(100)]
+
+# How long get_scene_names waits for a full send queue to drain
+_SEND_WAIT = 1.0
+
+def _address(table, number, template):
+    """Look up a cached address, formatting it for numbers outside the table"""
+    if 0 <= number < len(table):
+        return table[number]
+    return template.format(number)
+
 class X32AdvancedConnection:
     def __init__(self, ip_address: str = "192.168.1.100", port: int = 10023):
         self.ip_address = ip_address
@@ -22,16 +56,32 @@ class X32AdvancedConnection:
         self.socket = None
         self.connected = False
         self.message_queue = queue.Queue()
-        self.response_queue = queue.Queue()
+        # Single producer (listener thread): deque append/popleft need no lock.
+        # Bounded so unread replies cannot grow without limit.
+        self.response_queue = collections.deque(maxlen=4096)
+        self.response_event = threading.Event()
         self.listen_thread = None
         self.running = False
+        # Writing to _wake_send interrupts the listener's select() on disconnect
+        self._wake_recv = None
+        self._wake_send = None
         
     def connect(self) -> bool:
         """Connect to X32 with bidirectional communication"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.socket.settimeout(1.0)
+            self.socket.setblocking(False)
+            # Room for a whole refresh_scenes burst of requests and replies
+            for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+                try:
+                    self.socket.setsockopt(socket.SOL_SOCKET, option, 1 << 21)
+                except OSError as e:
+                    print(f"Could not enlarge socket buffer: {e}")
             self.socket.bind(('', 0))  # Bind to any available port
+            # Fix the peer once: send() skips the per-call address, and the
+            # kernel only delivers datagrams from the mixer
+            self.socket.connect((self.ip_address, self.port))
+            self._wake_recv, self._wake_send = socket.socketpair()
             self.connected = True
             self.running = True
             
@@ -48,21 +98,41 @@ class X32AdvancedConnection:
     def disconnect(self):
         """Disconnect from X32"""
         self.running = False
+        if self._wake_send:
+            self._wake_send.send(b'\x00')
+        if self.listen_thread:
+            self.listen_thread.join(timeout=1.0)
         if self.socket:
             self.socket.close()
+        if self._wake_send:
+            self._wake_send.close()
+            self._wake_recv.close()
+            self._wake_send = self._wake_recv = None
         self.connected = False
     
     def _listen_for_responses(self):
         """Listen for responses from X32"""
-        while self.running and self.connected:
-            try:
-                data, addr = self.socket.recvfrom(1024)
-                self.response_queue.put(data)
-            except socket.timeout:
-                continue
-            except Exception as e:
-                if self.running:
-                    print(f"Listen error: {e}")
+        view = memoryview(bytearray(1500))
+        receiver = BatchReceiver(self.socket)
+        with selectors.DefaultSelector() as selector:
+            selector.register(self.socket, selectors.EVENT_READ)
+            selector.register(self._wake_recv, selectors.EVENT_READ)
+            while self.running and self.connected:
+                try:
+                    events = selector.select()
+                    if any(key.fileobj is self._wake_recv for key, _ in events):
+                        break
+                    # Read the reply that woke us, then any that queued behind
+                    # it in a single batched read
+                    size = self.socket.recv_into(view)
+                    self.response_queue.append(view[:size].tobytes())
+                    self.response_queue.extend(receiver.drain())
+                    self.response_event.set()
+                except BlockingIOError:
+                    continue
+                except Exception as e:
+                    if self.running:
+                        print(f"Listen error: {e}")
     
     def send_message(self, address: str, *args):
         """Send OSC message to X32"""
@@ -71,93 +141,82 @@ class X32AdvancedConnection:
         
         try:
             msg = self._create_osc_message(address, *args)
-            self.socket.sendto(msg, (self.ip_address, self.port))
+            self.socket.send(msg)
+            return True
+        except Exception as e:
+            print(f"Send failed: {e}")
+            return False
+    
+    def send_bundle(self, messages: List[bytes]):
+        """Send encoded OSC messages to X32 as one #bundle datagram"""
+        if not self.connected:
+            return False
+        
+        try:
+            self.socket.send(create_osc_bundle(messages))
             return True
         except Exception as e:
             print(f"Send failed: {e}")
             return False
     
+    def send_updates(self, updates: Dict[str, Any]):
+        """Send single-value updates keyed by address, bundled when there are several"""
+        if len(updates) == 1:
+            (address, value), = updates.items()
+            return self.send_message(address, value)
+        return self.send_bundle([self._create_osc_message(address, value)
+                                 for address, value in updates.items()])
+    
     def _create_osc_message(self, address: str, *args) -> bytes:
         """Create proper OSC message"""
-        # OSC address pattern
-        msg = address.encode('utf-8')
-        msg += b'\x00' * ((4 - len(msg) % 4) % 4)
-        
-        # Type tag string
-        type_tags = ','
-        for arg in args:
-            if isinstance(arg, int):
-                type_tags += 'i'
-            elif isinstance(arg, float):
-                type_tags += 'f'
-            elif isinstance(arg, str):
-                type_tags += 's'
-            elif isinstance(arg, bool):
-                type_tags += 'T' if arg else 'F'
-        
-        type_tags += '\x00'
-        msg += type_tags.encode('utf-8')
-        msg += b'\x00' * ((4 - len(type_tags) % 4) % 4)
-        
-        # Arguments
-        for arg in args:
-            if isinstance(arg, int):
-                msg += struct.pack('>i', arg)
-            elif isinstance(arg, float):
-                msg += struct.pack('>f', arg)
-            elif isinstance(arg, str):
-                str_bytes = arg.encode('utf-8')
-                msg += str_bytes
-                msg += b'\x00' * ((4 - len(str_bytes) % 4) % 4)
-            elif isinstance(arg, bool):
-                # Boolean values don't add data to OSC message
-                pass
-        
-        return msg
+        return create_osc_message(address, *args)
     
     # Channel Controls
     def send_channel_fader(self, channel: int, level: float):
         """Send channel fader level"""
-        return self.send_message(f"/ch/{channel:02d}/mix/fader", level)
+        return self.send_message(_address(_CH_FADER_ADDR, channel, _CH_FADER), level)
     
     def send_channel_mute(self, channel: int, mute: bool):
         """Send channel mute state"""
-        return self.send_message(f"/ch/{channel:02d}/mix/on", 0 if mute else 1)
+        return self.send_message(_address(_CH_ON_ADDR, channel, _CH_ON), 0 if mute else 1)
     
     def send_channel_pan(self, channel: int, pan: float):
         """Send channel pan position (-100 to +100)"""
-        return self.send_message(f"/ch/{channel:02d}/mix/pan", pan)
+        return self.send_message(_address(_CH_PAN_ADDR, channel, _CH_PAN), pan)
     
     def send_channel_name(self, channel: int, name: str):
         """Send channel name"""
-        return self.send_message(f"/ch/{channel:02d}/config/name", name)
+        return self.send_message(_address(_CH_NAME_ADDR, channel, _CH_NAME), name)
     
     # EQ Controls
     def send_channel_eq_band(self, channel: int, band: int, enabled: bool, freq: float, gain: float, q: float):
         """Send channel EQ band settings"""
         base_addr = f"/ch/{channel:02d}/eq/{band}"
-        self.send_message(f"{base_addr}/on", 1 if enabled else 0)
-        self.send_message(f"{base_addr}/f", freq)
-        self.send_message(f"{base_addr}/g", gain)
-        self.send_message(f"{base_addr}/q", q)
+        # One datagram for the whole band instead of four
+        return self.send_bundle([
+            self._create_osc_message(f"{base_addr}/on", 1 if enabled else 0),
+            self._create_osc_message(f"{base_addr}/f", freq),
+            self._create_osc_message(f"{base_addr}/g", gain),
+            self._create_osc_message(f"{base_addr}/q", q),
+        ])
     
     # Bus Controls
     def send_bus_fader(self, bus: int, level: float):
         """Send bus fader level"""
-        return self.send_message(f"/bus/{bus:02d}/mix/fader", level)
+        return self.send_message(_address(_BUS_FADER_ADDR, bus, _BUS_FADER), level)
     
     def send_bus_mute(self, bus: int, mute: bool):
         """Send bus mute state"""
-        return self.send_message(f"/bus/{bus:02d}/mix/on", 0 if mute else 1)
+        return self.send_message(_address(_BUS_ON_ADDR, bus, _BUS_ON), 0 if mute else 1)
     
     def send_bus_name(self, bus: int, name: str):
         """Send bus name"""
-        return self.send_message(f"/bus/{bus:02d}/config/name", name)
+        return self.send_message(_address(_BUS_NAME_ADDR, bus, _BUS_NAME), name)
     
     # Main Controls
     def send_main_fader(self, level: float):
         """Send main stereo fader level"""
-        return self.send_message("/main/st/mix/fader", level)
+        return self.send_message(_MAIN_FADER, level)
     
     def send_main_mute(self, mute: bool):
         """Send main stereo mute state"""
@@ -183,7 +242,38 @@ class X32AdvancedConnection:
     
     def get_scene_name(self, scene_number: int):
         """Request scene name"""
-        return self.send_message(f"/-ssn/{scene_number:03d}/config/name")
+        return self.send_message(_address(_SCENE_NAME_ADDR, scene_number, _SCENE_NAME))
+    
+    def get_scene_names(self, first: int, last: int):
+        """Request names of scenes first..last-1 in as few datagrams as fit"""
+        if not self.connected:
+            return False
+        
+        try:
+            messages = [self._create_osc_message(_address(_SCENE_NAME_ADDR, i, _SCENE_NAME))
+                        for i in range(first, last)]
+            groups = group_messages(messages)
+            bundles = [create_osc_bundle(group) for group in groups]
+            sent = 0
+            while sent < len(bundles):
+                try:
+                    sent += send_many(self.socket, bundles[sent:])
+                except BlockingIOError:
+                    pass  # Nothing went out this round
+                if sent == len(bundles):
+                    break
+                # The socket is non-blocking; wait for the send queue to drain
+                # and re-send the bundles that did not fit
+                _, writable, _ = select.select([], [self.socket], [], _SEND_WAIT)
+                if not writable:
+                    requested = first + sum(len(group) for group in groups[:sent])
+                    print(f"Send failed: socket send buffer full, scenes "
+                          f"{requested}..{last - 1} not requested")
+                    return False
+            return True
+        except Exception as e:
+            print(f"Send failed: {e}")
+            return False
 
 class X32AdvancedApp:
     def __init__(self, root):
@@ -203,6 +293,10 @@ class X32AdvancedApp:
         self.scenes = {}
         self.current_scene = 0
         
+        # Latest slider value per address, sent once per Tk idle cycle
+        self._pending = {}
+        self._flush_scheduled = False
+        
         self.setup_gui()
         self.setup_menu()
         
@@ -448,15 +542,29 @@ class X32AdvancedApp:
             messagebox.showinfo("Info", "Disconnected from X32")
     
     # Event handlers
+    def _queue_update(self, address: str, value: float):
+        """Queue a slider value; a drag only sends the last value per idle cycle"""
+        self._pending[address] = value
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._flush_pending)
+    
+    def _flush_pending(self):
+        """Send queued slider values as one datagram"""
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        if pending and self.x32.connected:
+            self.x32.send_updates(pending)
+    
     def on_channel_fader_change(self, channel: int, value: float):
         """Handle channel fader change"""
         if self.x32.connected:
-            self.x32.send_channel_fader(channel, value)
+            self._queue_update(_address(_CH_FADER_ADDR, channel, _CH_FADER), value)
     
     def on_channel_pan_change(self, channel: int, value: float):
         """Handle channel pan change"""
         if self.x32.connected:
-            self.x32.send_channel_pan(channel, value)
+            self._queue_update(_address(_CH_PAN_ADDR, channel, _CH_PAN), value)
     
     def on_channel_mute_change(self, channel: int):
         """Handle channel mute change"""
@@ -467,7 +575,7 @@ class X32AdvancedApp:
     def on_bus_fader_change(self, bus: int, value: float):
         """Handle bus fader change"""
         if self.x32.connected:
-            self.x32.send_bus_fader(bus, value)
+            self._queue_update(_address(_BUS_FADER_ADDR, bus, _BUS_FADER), value)
     
     def on_bus_mute_change(self, bus: int):
         """Handle bus mute change"""
@@ -478,7 +586,7 @@ class X32AdvancedApp:
     def on_main_fader_change(self, value: float):
         """Handle main fader change"""
         if self.x32.connected:
-            self.x32.send_main_fader(value)
+            self._queue_update(_MAIN_FADER, value)
             self.main_fader_label.config(text=f"{value:.1f} dB")
     
     def on_main_mute_change(self):
@@ -533,9 +641,9 @@ class X32AdvancedApp:
         self.scene_listbox.delete(0, tk.END)
         
         # Request scene names (this would need proper OSC implementation)
-        for i in range(100):  # First 100 scenes
-            self.x32.get_scene_name(i)
-            self.scene_listbox.insert(tk.END, f"Scene {i:03d}")
+        self.x32.get_scene_names(0, 100)  # First 100 scenes
+        # One insert call: a single Tcl command and layout pass for all rows
+        self.scene_listbox.insert(tk.END, *[f"Scene {i:03d}" for i in range(100)])
     
     def load_selected_scene(self):
         """Load selected scene"""
@@ -153,62 +153,47 @@ class X32OSCConnection:
     def _parse_osc_message(self, data: bytes):
         """Parse incoming OSC message"""
         try:
+            # Walk the packet by offset; every field starts on a 4-byte boundary
             # Parse address
             null_pos = data.find(b'\x00')
             if null_pos == -1:
                 return
             
             address = data[:null_pos].decode('utf-8')
-            data = data[null_pos:]
+            pos = (null_pos + 4) & ~3
             
             # Find type tags
-            while data and data[0] == 0:
-                data = data[1:]
-            
-            if not data:
-                return
-            
-            null_pos = data.find(b'\x00')
+            null_pos = data.find(b'\x00', pos)
             if null_pos == -1:
                 return
             
-            type_tags = data[:null_pos].decode('utf-8')
-            data = data[null_pos:]
-            
-            # Skip padding
-            while data and data[0] == 0:
-                data = data[1:]
+            type_tags = data[pos:null_pos].decode('utf-8')
+            pos = (null_pos + 4) & ~3
             
             # Parse arguments
             args = []
             for tag in type_tags[1:]:  # Skip comma
                 if tag == 's':  # String
-                    null_pos = data.find(b'\x00')
+                    null_pos = data.find(b'\x00', pos)
                     if null_pos == -1:
                         break
-                    args.append(data[:null_pos].decode('utf-8'))
-                    data = data[null_pos:]
-                    # Skip padding
-                    while data and data[0] == 0:
-                        data = data[1:]
+                    args.append(data[pos:null_pos].decode('utf-8'))
+                    pos = (null_pos + 4) & ~3
                 elif tag == 'i':  # Integer
-                    if len(data) >= 4:
-                        args.append(struct.unpack('>i', data[:4])[0])
-                        data = data[4:]
+                    if len(data) >= pos + 4:
+                        args.append(struct.unpack_from('>i', data, pos)[0])
+                        pos += 4
                 elif tag == 'f':  # Float
-                    if len(data) >= 4:
-                        args.append(struct.unpack('>f', data[:4])[0])
-                        data = data[4:]
+                    if len(data) >= pos + 4:
+                        args.append(struct.unpack_from('>f', data, pos)[0])
+                        pos += 4
                 elif tag == 'b':  # Blob
-                    if len(data) >= 4:
-                        size = struct.unpack('>i', data[:4])[0]
-                        data = data[4:]
-                        if len(data) >= size:
-                            args.append(data[:size])
-                            data = data[size:]
-                            # Skip padding
-                            while data and data[0] == 0:
-                                data = data[1:]
+                    if len(data) >= pos + 4:
+                        size = struct.unpack_from('>i', data, pos)[0]
+                        pos += 4
+                        if len(data) >= pos + size:
+                            args.append(data[pos:pos + size])
+                            pos += (size + 3) & ~3
             
             # Handle the message
             self._handle_message(address, args)
@@ -7,10 +7,10 @@ Watches a local .scn file and automatically applies changes to X32 console
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import socket
+import select
 import threading
 import time
 import json
-import struct
 import os
 import hashlib
 from typing import Dict, Any, Optional, List
@@ -19,6 +19,9 @@ from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import re
 
+from osc_batch import send_many
+from osc_codec import create_osc_message
+
 class SceneParser:
     """Parse and apply X32 scene file changes"""
     
@@ -303,6 +306,8 @@ class X32Connection:
         """Connect to X32"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            # Room for a whole batch of changes in the kernel send queue
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
             self.socket.settimeout(1.0)
             self.connected = True
             return True
@@ -331,109 +336,100 @@ class X32Connection:
     
     def _create_osc_message(self, address: str, *args) -> bytes:
         """Create proper OSC message"""
-        # OSC address pattern
-        msg = address.encode('utf-8')
-        msg += b'\x00' * ((4 - len(msg) % 4) % 4)
-        
-        # Type tag string
-        type_tags = ','
-        for arg in args:
-            if isinstance(arg, int):
-                type_tags += 'i'
-            elif isinstance(arg, float):
-                type_tags += 'f'
-            elif isinstance(arg, str):
-                type_tags += 's'
-            elif isinstance(arg, bool):
-                type_tags += 'T' if arg else 'F'
-        
-        type_tags += '\x00'
-        msg += type_tags.encode('utf-8')
-        msg += b'\x00' * ((4 - len(type_tags) % 4) % 4)
-        
-        # Arguments
-        for arg in args:
-            if isinstance(arg, int):
-                msg += struct.pack('>i', arg)
-            elif isinstance(arg, float):
-                msg += struct.pack('>f', arg)
-            elif isinstance(arg, str):
-                str_bytes = arg.encode('utf-8')
-                msg += str_bytes
-                msg += b'\x00' * ((4 - len(str_bytes) % 4) % 4)
-            elif isinstance(arg, bool):
-                pass
-        
-        return msg
+        return create_osc_message(address, *args)
     
     def apply_changes(self, changes: List[Dict]) -> bool:
         """Apply detected changes to X32 console"""
         if not self.connected:
             return False
         
-        success_count = 0
+        packets = []
         for change in changes:
             try:
                 if change['type'] == 'channel':
-                    success = self._apply_channel_change(change)
+                    msg = self._channel_change_message(change)
                 elif change['type'] == 'bus':
-                    success = self._apply_bus_change(change)
+                    msg = self._bus_change_message(change)
                 elif change['type'] == 'main':
-                    success = self._apply_main_change(change)
+                    msg = self._main_change_message(change)
                 else:
-                    success = False
+                    msg = None
                 
-                if success:
-                    success_count += 1
+                if msg is not None:
+                    packets.append(msg)
                     
             except Exception as e:
                 print(f"Error applying change {change}: {e}")
         
-        return success_count > 0
+        if not packets:
+            return False
+        
+        # Hand the whole batch to the kernel at once (sendmmsg on Linux). The
+        # socket's timeout makes it non-blocking underneath, so a full send
+        # queue can cut the burst short; wait for it to drain and send the rest
+        sent = 0
+        try:
+            while sent < len(packets):
+                try:
+                    sent += send_many(self.socket, packets[sent:], (self.ip_address, self.port))
+                except BlockingIOError:
+                    pass  # Nothing went out this round
+                if sent == len(packets):
+                    break
+                _, writable, _ = select.select([], [self.socket], [], self.socket.gettimeout())
+                if not writable:
+                    print(f"Send failed: socket send buffer full, "
+                          f"{len(packets) - sent} of {len(packets)} changes not sent")
+                    return False
+        except Exception as e:
+            print(f"Send failed after {sent} of {len(packets)} changes: {e}")
+            return False
+        
+        return True
     
-    def _apply_channel_change(self, change: Dict) -> bool:
-        """Apply channel parameter change"""
+    def _channel_change_message(self, change: Dict) -> Optional[bytes]:
+        """Encode a channel parameter change, or None if it is not sent"""
         ch_num = change['number']
         param = change['parameter']
         value = change['new_value']
         
         if param == 'fader':
-            return self.send_message(f"/ch/{ch_num:02d}/mix/fader", value)
+            return self._create_osc_message(f"/ch/{ch_num:02d}/mix/fader", value)
         elif param == 'mute':
-            return self.send_message(f"/ch/{ch_num:02d}/mix/on", 0 if value else 1)
+            return self._create_osc_message(f"/ch/{ch_num:02d}/mix/on", 0 if value else 1)
         elif param == 'pan':
-            return self.send_message(f"/ch/{ch_num:02d}/mix/pan", value)
+            return self._create_osc_message(f"/ch/{ch_num:02d}/mix/pan", value)
         elif param == 'name':
-            return self.send_message(f"/ch/{ch_num:02d}/config/name", value)
+            return self._create_osc_message(f"/ch/{ch_num:02d}/config/name", value)
         
-        return False
+        return None
     
-    def _apply_bus_change(self, change: Dict) -> bool:
-        """Apply bus parameter change"""
+    def _bus_change_message(self, change: Dict) -> Optional[bytes]:
+        """Encode a bus parameter change, or None if it is not sent"""
         bus_num = change['number']
         param = change['parameter']
         value = change['new_value']
         
         if param == 'fader':
-            return self.send_message(f"/bus/{bus_num:02d}/mix/fader", value)
+            return self._create_osc_message(f"/bus/{bus_num:02d}/mix/fader", value)
         elif param == 'mute':
-            return self.send_message(f"/bus/{bus_num:02d}/mix/on", 0 if value else 1)
+            return self._create_osc_message(f"/bus/{bus_num:02d}/mix/on", 0 if value else 1)
         elif param == 'name':
-            return self.send_message(f"/bus/{bus_num:02d}/config/name", value)
+            return self._create_osc_message(f"/bus/{bus_num:02d}/config/name", value)
         
-        return False
+        return None
     
-    def _apply_main_change(self, change: Dict) -> bool:
-        """Apply main parameter change"""
+    def _main_change_message(self, change: Dict) -> Optional[bytes]:
+        """Encode a main parameter change, or None if it is not sent"""
         param = change['parameter']
         value = change['new_value']
         
         if param == 'fader':
-            return self.send_message("/main/st/mix/fader", value)
+            return self._create_osc_message("/main/st/mix/fader", value)
         elif param == 'mute':
-            return self.send_message("/main/st/mix/on", 0 if value else 1)
+            return self._create_osc_message("/main/st/mix/on", 0 if value else 1)
         
-        return False
+        return None
 
 class SceneFileHandler(FileSystemEventHandler):
     """File system event handler for scene file changes"""
@@ -486,7 +482,12 @@ class X32SceneMonitor:
         self.monitoring_var = tk.StringVar(value="Not Monitoring")
         self.file_var = tk.StringVar(value="No file selected")
         
+        # Log lines are queued (watchdog calls in from its own thread) and
+        # written to the status box in one insert per tick
+        self.log_queue = queue.SimpleQueue()
+        
         self.setup_gui()
+        self._flush_log()
         
     def setup_gui(self):
         """Setup the GUI interface"""
@@ -659,16 +660,29 @@ class X32SceneMonitor:
             self.changes_text.insert(tk.END, change_text)
     
     def log_message(self, message: str):
-        """Log message to status text"""
+        """Queue a message for the status text"""
         timestamp = time.strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        self.status_text.insert(tk.END, log_entry)
-        self.status_text.see(tk.END)
-        
-        # Limit log size
-        lines = self.status_text.get(1.0, tk.END).split('\n')
-        if len(lines) > 100:
-            self.status_text.delete(1.0, f"{len(lines)-100}.0")
+        self.log_queue.put(f"[{timestamp}] {message}\n")
+    
+    def _flush_log(self):
+        """Write all queued log messages to the status text"""
+        entries = []
+        try:
+            while True:
+                entries.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if entries:
+            self.status_text.insert(tk.END, "".join(entries))
+            self.status_text.see(tk.END)
+            
+            # Limit log size
+            lines = int(self.status_text.index("end-1c").split(".")[0]) + 1
+            if lines > 100:
+                self.status_text.delete(1.0, f"{lines-100}.0")
+        
+        self.root.after(50, self._flush_log)
 
 def main():
     root = tk.Tk()
@@ -7,15 +7,25 @@ A more basic version that should work better with older Tk versions
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import socket
-import struct
 import threading
 import time
 import os
 import hashlib
+import queue
 from datetime import datetime
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+from osc_codec import create_osc_message
+
+# Map scene dB to normalized using our calibration
+# 0.0 dB scene → 0.75 normalized (unity gain)
+# +5.0 dB scene → 0.563 normalized (gives -7.5 dB console)
+_SCENE_DB1, _NORMALIZED1 = 0.0, 0.75  # unity gain
+_SCENE_DB2, _NORMALIZED2 = 5.0, 0.563  # known working value
+_FADER_SLOPE = (_NORMALIZED2 - _NORMALIZED1) / (_SCENE_DB2 - _SCENE_DB1)
+_FADER_INTERCEPT = _NORMALIZED1 - _FADER_SLOPE * _SCENE_DB1
+
 class SimpleX32Connection:
     """Simple X32 connection handler"""
     
@@ -27,35 +37,7 @@ class SimpleX32Connection:
     
     def create_osc_message(self, address, *args):
         """Create OSC message"""
-        message = address.encode('utf-8')
-        message += b'\x00' * (4 - len(message) % 4)
-        
-        type_tags = ','
-        for arg in args:
-            if isinstance(arg, bool):
-                type_tags += 'T' if arg else 'F'
-            elif isinstance(arg, int):
-                type_tags += 'i'
-            elif isinstance(arg, float):
-                type_tags += 'f'
-            elif isinstance(arg, str):
-                type_tags += 's'
-        
-        message += type_tags.encode('utf-8')
-        message += b'\x00' * (4 - len(type_tags) % 4)
-        
-        for arg in args:
-            if isinstance(arg, bool):
-                pass
-            elif isinstance(arg, int):
-                message += struct.pack('>i', arg)
-            elif isinstance(arg, float):
-                message += struct.pack('>f', arg)
-            elif isinstance(arg, str):
-                message += arg.encode('utf-8')
-                message += b'\x00' * (4 - len(arg.encode('utf-8')) % 4)
-        
-        return message
+        return create_osc_message(address, *args)
     
     def test_connection(self):
         """Test if X32 console is actually reachable"""
@@ -152,7 +134,12 @@ class SimpleX32SceneMonitor:
         self.monitoring_var = tk.StringVar(value="Not Monitoring")
         self.file_var = tk.StringVar(value="No file selected")
         
+        # Log lines are queued (watchdog calls in from its own thread) and
+        # written to the status box in one insert per tick
+        self.log_queue = queue.SimpleQueue()
+        
         self.setup_gui()
+        self._flush_log()
         
         # Auto-startup: Connect, select file, and start monitoring
         self.auto_startup()
@@ -606,11 +593,24 @@ class SimpleX32SceneMonitor:
         self.log_message(f"{status_icon} {action}: Channel {channel} | {address} = {value}")
     
     def log_message(self, message):
-        """Log message to status"""
+        """Queue a message for the status log"""
         timestamp = time.strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        self.status_text.insert(tk.END, log_entry)
-        self.status_text.see(tk.END)
+        self.log_queue.put(f"[{timestamp}] {message}\n")
+    
+    def _flush_log(self):
+        """Write all queued log messages to the status log"""
+        entries = []
+        try:
+            while True:
+                entries.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if entries:
+            self.status_text.insert(tk.END, "".join(entries))
+            self.status_text.see(tk.END)
+        
+        self.root.after(50, self._flush_log)
 
     def auto_startup(self):
         """Auto-startup: Connect to X32, select integrated.scn, and start monitoring"""
@@ -702,18 +702,7 @@ class SimpleX32SceneMonitor:
         elif db_value >= 10:
             return 1.0
         else:
-            # Map scene dB to normalized using our calibration
-            # 0.0 dB scene → 0.75 normalized (unity gain)
-            # +5.0 dB scene → 0.563 normalized (gives -7.5 dB console)
-            
-            # Calculate the slope
-            scene_db1, normalized1 = 0.0, 0.75  # unity gain
-            scene_db2, normalized2 = 5.0, 0.563  # known working value
-            
-            slope = (normalized2 - normalized1) / (scene_db2 - scene_db1)
-            intercept = normalized1 - slope * scene_db1
-            
-            normalized = slope * db_value + intercept
+            normalized = _FADER_SLOPE * db_value + _FADER_INTERCEPT
             return max(0.0, min(1.0, normalized))
 
 def main():